@@ -1,46 +1,49 @@
 """The LADWP Energy Cost integration."""
+from dataclasses import dataclass
 import logging
+from typing import Any
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = [Platform.SENSOR]
 
+
+@dataclass(slots=True)
+class LADWPRuntimeData:
+    """Runtime data for a LADWP Energy Cost config entry."""
+
+    config: dict[str, Any]
+
+
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the LADWP Energy Cost component from configuration.yaml."""
     _LOGGER.debug("Setting up LADWP Energy Cost from YAML")
-    hass.data.setdefault(DOMAIN, {})
     return True
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up LADWP Energy Cost from a config entry."""
-    _LOGGER.debug("Setting up LADWP Energy Cost entry: %s", entry.entry_id)
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = entry.data
-    
-    _LOGGER.debug("Forwarding entry setup to platforms: %s", PLATFORMS)
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Options override the values chosen when the entry was created
+    entry.runtime_data = LADWPRuntimeData(config={**entry.data, **entry.options})
     
     entry.async_on_unload(entry.add_update_listener(update_listener))
-    _LOGGER.debug("LADWP Energy Cost entry setup complete")
+    
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
+    # Saving the options form unchanged still fires the listener; skip the reload
+    if {**entry.data, **entry.options} == entry.runtime_data.config:
+        return
+    
     _LOGGER.debug("Reloading LADWP Energy Cost due to options update")
-    await hass.config_entries.async_reload(entry.entry_id)
+    # Schedule the reload so the listener returns before the entry is torn down
+    hass.config_entries.async_schedule_reload(entry.entry_id)
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    _LOGGER.debug("Unloading LADWP Energy Cost entry: %s", entry.entry_id)
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
-    if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
-        _LOGGER.debug("LADWP Energy Cost entry unloaded successfully")
-    else:
-        _LOGGER.error("Failed to unload LADWP Energy Cost entry")
-    
-    return unload_ok
+    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
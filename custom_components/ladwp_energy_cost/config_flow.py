@@ -1,12 +1,12 @@
 """Config flow for LADWP Energy Cost integration."""
+from functools import lru_cache
 import logging
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import selector
-import homeassistant.helpers.config_validation as cv
 
 from .const import (
     DOMAIN,
@@ -29,6 +29,51 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Selectors shared by the user and options step schemas
+# SelectSelectorConfig validates options as a list, so the tuples are copied once here
+_ENTITY_SEL = selector.EntitySelector(selector.EntitySelectorConfig(domain="sensor"))
+_RATE_PLAN_SEL = selector.SelectSelector(
+    selector.SelectSelectorConfig(options=list(RATE_PLAN_OPTIONS), translation_key="rate_plan")
+)
+_ZONE_SEL = selector.SelectSelector(
+    selector.SelectSelectorConfig(options=list(ZONE_OPTIONS), translation_key="zone")
+)
+_BILLING_PERIOD_SEL = selector.SelectSelector(
+    selector.SelectSelectorConfig(options=list(BILLING_PERIOD_OPTIONS), translation_key="billing_period")
+)
+_BILLING_DAY_SEL = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=1, max=31, mode="slider")
+)
+
+# Build the user step schema once at import and reuse it for every form render.
+# vol.Schema compiles its validators in the constructor, so no warm-up call is needed.
+USER_STEP_SCHEMA = vol.Schema(
+    {
+        vol.Required("name", default=DEFAULT_NAME): str,
+        vol.Required(CONF_GRID_POWER_ENTITY): _ENTITY_SEL,
+        vol.Optional(CONF_SOLAR_POWER_ENTITY): _ENTITY_SEL,
+        vol.Optional(CONF_LOAD_POWER_ENTITY): _ENTITY_SEL,
+        vol.Required(CONF_RATE_PLAN, default=DEFAULT_RATE_PLAN): _RATE_PLAN_SEL,
+        vol.Required(CONF_ZONE, default=DEFAULT_ZONE): _ZONE_SEL,
+        vol.Required(CONF_BILLING_PERIOD, default=DEFAULT_BILLING_PERIOD): _BILLING_PERIOD_SEL,
+        vol.Required(CONF_BILLING_DAY, default=DEFAULT_BILLING_DAY): _BILLING_DAY_SEL,
+    }
+)
+
+
+@lru_cache(maxsize=32)
+def _build_options_schema(rate_plan, zone, billing_period, billing_day) -> vol.Schema:
+    """Build the options schema for the given current values."""
+    return vol.Schema(
+        {
+            vol.Required(CONF_RATE_PLAN, default=rate_plan): _RATE_PLAN_SEL,
+            vol.Required(CONF_ZONE, default=zone): _ZONE_SEL,
+            vol.Required(CONF_BILLING_PERIOD, default=billing_period): _BILLING_PERIOD_SEL,
+            vol.Required(CONF_BILLING_DAY, default=billing_day): _BILLING_DAY_SEL,
+        }
+    )
+
+
 class LADWPEnergyConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for LADWP Energy Cost."""
 
@@ -50,36 +95,8 @@ class LADWPEnergyConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     data=user_input,
                 )
 
-        # Show the form to the user
-        schema = vol.Schema(
-            {
-                vol.Required("name", default=DEFAULT_NAME): str,
-                vol.Required(CONF_GRID_POWER_ENTITY): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Optional(CONF_SOLAR_POWER_ENTITY): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Optional(CONF_LOAD_POWER_ENTITY): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Required(CONF_RATE_PLAN, default=DEFAULT_RATE_PLAN): selector.SelectSelector(
-                    selector.SelectSelectorConfig(options=RATE_PLAN_OPTIONS, translation_key="rate_plan")
-                ),
-                vol.Required(CONF_ZONE, default=DEFAULT_ZONE): selector.SelectSelector(
-                    selector.SelectSelectorConfig(options=ZONE_OPTIONS, translation_key="zone")
-                ),
-                vol.Required(CONF_BILLING_PERIOD, default=DEFAULT_BILLING_PERIOD): selector.SelectSelector(
-                    selector.SelectSelectorConfig(options=BILLING_PERIOD_OPTIONS, translation_key="billing_period")
-                ),
-                vol.Required(CONF_BILLING_DAY, default=DEFAULT_BILLING_DAY): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=1, max=31, mode="slider")
-                ),
-            }
-        )
-
         return self.async_show_form(
-            step_id="user", data_schema=schema, errors=errors
+            step_id="user", data_schema=USER_STEP_SCHEMA, errors=errors
         )
 
     @staticmethod
@@ -104,35 +121,14 @@ class LADWPEnergyOptionsFlow(config_entries.OptionsFlow):
             # Update entry
             return self.async_create_entry(title="", data=user_input)
 
-        # Fill form with current values or defaults
-        current = self.config_entry.options
-        schema = vol.Schema(
-            {
-                vol.Required(
-                    CONF_RATE_PLAN,
-                    default=current.get(CONF_RATE_PLAN, DEFAULT_RATE_PLAN),
-                ): selector.SelectSelector(
-                    selector.SelectSelectorConfig(options=RATE_PLAN_OPTIONS, translation_key="rate_plan")
-                ),
-                vol.Required(
-                    CONF_ZONE,
-                    default=current.get(CONF_ZONE, DEFAULT_ZONE),
-                ): selector.SelectSelector(
-                    selector.SelectSelectorConfig(options=ZONE_OPTIONS, translation_key="zone")
-                ),
-                vol.Required(
-                    CONF_BILLING_PERIOD,
-                    default=current.get(CONF_BILLING_PERIOD, DEFAULT_BILLING_PERIOD),
-                ): selector.SelectSelector(
-                    selector.SelectSelectorConfig(options=BILLING_PERIOD_OPTIONS, translation_key="billing_period")
-                ),
-                vol.Required(
-                    CONF_BILLING_DAY,
-                    default=current.get(CONF_BILLING_DAY, DEFAULT_BILLING_DAY),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=1, max=31, mode="slider")
-                ),
-            }
+        # Fill form with the effective values (options override the initial
+        # setup data) or defaults
+        current = {**self.config_entry.data, **self.config_entry.options}
+        schema = _build_options_schema(
+            current.get(CONF_RATE_PLAN, DEFAULT_RATE_PLAN),
+            current.get(CONF_ZONE, DEFAULT_ZONE),
+            current.get(CONF_BILLING_PERIOD, DEFAULT_BILLING_PERIOD),
+            current.get(CONF_BILLING_DAY, DEFAULT_BILLING_DAY),
         )
 
         return self.async_show_form(
@@ -1,7 +1,6 @@
 """Constants for the LADWP Energy Cost Calculator integration."""
 from datetime import time
-import voluptuous as vol
-from homeassistant.const import CONF_NAME, CONF_ENTITY_ID
+from functools import lru_cache
 
 DOMAIN = "ladwp_energy_cost"
 
@@ -17,17 +16,21 @@ CONF_BILLING_PERIOD = "billing_period"
 # Rate plan options
 RATE_PLAN_STANDARD = "standard"
 RATE_PLAN_TIME_OF_USE = "time_of_use"
-RATE_PLAN_OPTIONS = [RATE_PLAN_STANDARD, RATE_PLAN_TIME_OF_USE]
+RATE_PLAN_OPTIONS = (RATE_PLAN_STANDARD, RATE_PLAN_TIME_OF_USE)
 
 # Zone options
 ZONE_1 = "zone_1"
 ZONE_2 = "zone_2"
-ZONE_OPTIONS = [ZONE_1, ZONE_2]
+ZONE_OPTIONS = (ZONE_1, ZONE_2)
 
 # Billing period options
 BILLING_MONTHLY = "monthly"
 BILLING_BIMONTHLY = "bimonthly"
-BILLING_PERIOD_OPTIONS = [BILLING_MONTHLY, BILLING_BIMONTHLY]
+BILLING_PERIOD_OPTIONS = (BILLING_MONTHLY, BILLING_BIMONTHLY)
+
+# Rate table keys
+TIER1, TIER2, TIER3 = "tier1", "tier2", "tier3"
+HIGH_PEAK, LOW_PEAK, BASE = "high_peak", "low_peak", "base"
 
 # Default values
 DEFAULT_NAME = "LADWP Energy Cost"
@@ -81,6 +84,13 @@ TIER_LIMITS = {
     },
 }
 
+# (zone, billing_period) -> (tier1_limit, tier2_limit)
+TIER_LIMITS_FLAT = {
+    (zone, period): (limits["tier1_limit"], limits["tier2_limit"])
+    for zone, periods in TIER_LIMITS.items()
+    for period, limits in periods.items()
+}
+
 # Standard Residential (R-1A) Rates
 # These values include all adjustment factors
 # Legacy tier limits (for backward compatibility)
@@ -91,55 +101,55 @@ TIER2_LIMIT = 1050  # kWh (Zone 1 Monthly)
 # Format: Year -> Month -> Tier
 STANDARD_RATES_2024 = {
     # January - March
-    1: {"tier1": 0.20042, "tier2": 0.25901, "tier3": 0.25901},
-    2: {"tier1": 0.20042, "tier2": 0.25901, "tier3": 0.25901},
-    3: {"tier1": 0.20042, "tier2": 0.25901, "tier3": 0.25901},
+    1: {TIER1: 0.20042, TIER2: 0.25901, TIER3: 0.25901},
+    2: {TIER1: 0.20042, TIER2: 0.25901, TIER3: 0.25901},
+    3: {TIER1: 0.20042, TIER2: 0.25901, TIER3: 0.25901},
     # April - May
-    4: {"tier1": 0.19645, "tier2": 0.25504, "tier3": 0.25504},
-    5: {"tier1": 0.19645, "tier2": 0.25504, "tier3": 0.25504},
+    4: {TIER1: 0.19645, TIER2: 0.25504, TIER3: 0.25504},
+    5: {TIER1: 0.19645, TIER2: 0.25504, TIER3: 0.25504},
     # June
-    6: {"tier1": 0.19645, "tier2": 0.25504, "tier3": 0.34205},
+    6: {TIER1: 0.19645, TIER2: 0.25504, TIER3: 0.34205},
     # July - September
-    7: {"tier1": 0.21169, "tier2": 0.27028, "tier3": 0.35729},
-    8: {"tier1": 0.21169, "tier2": 0.27028, "tier3": 0.35729},
-    9: {"tier1": 0.21169, "tier2": 0.27028, "tier3": 0.35729},
+    7: {TIER1: 0.21169, TIER2: 0.27028, TIER3: 0.35729},
+    8: {TIER1: 0.21169, TIER2: 0.27028, TIER3: 0.35729},
+    9: {TIER1: 0.21169, TIER2: 0.27028, TIER3: 0.35729},
     # October - December
-    10: {"tier1": 0.21408, "tier2": 0.27267, "tier3": 0.27267},
-    11: {"tier1": 0.21408, "tier2": 0.27267, "tier3": 0.27267},
-    12: {"tier1": 0.21408, "tier2": 0.27267, "tier3": 0.27267},
+    10: {TIER1: 0.21408, TIER2: 0.27267, TIER3: 0.27267},
+    11: {TIER1: 0.21408, TIER2: 0.27267, TIER3: 0.27267},
+    12: {TIER1: 0.21408, TIER2: 0.27267, TIER3: 0.27267},
 }
 
 STANDARD_RATES_2025 = {
     # January - March
-    1: {"tier1": 0.22296, "tier2": 0.28155, "tier3": 0.28155},
-    2: {"tier1": 0.22296, "tier2": 0.28155, "tier3": 0.28155},
-    3: {"tier1": 0.22296, "tier2": 0.28155, "tier3": 0.28155},
+    1: {TIER1: 0.22296, TIER2: 0.28155, TIER3: 0.28155},
+    2: {TIER1: 0.22296, TIER2: 0.28155, TIER3: 0.28155},
+    3: {TIER1: 0.22296, TIER2: 0.28155, TIER3: 0.28155},
     # April - May
-    4: {"tier1": 0.22765, "tier2": 0.28624, "tier3": 0.28624},
-    5: {"tier1": 0.22765, "tier2": 0.28624, "tier3": 0.28624},
+    4: {TIER1: 0.22765, TIER2: 0.28624, TIER3: 0.28624},
+    5: {TIER1: 0.22765, TIER2: 0.28624, TIER3: 0.28624},
     # June
-    6: {"tier1": 0.22765, "tier2": 0.28624, "tier3": 0.37325},
+    6: {TIER1: 0.22765, TIER2: 0.28624, TIER3: 0.37325},
     # July - September (using June rates as placeholder until actual rates are available)
-    7: {"tier1": 0.22765, "tier2": 0.28624, "tier3": 0.37325},
-    8: {"tier1": 0.22765, "tier2": 0.28624, "tier3": 0.37325},
-    9: {"tier1": 0.22765, "tier2": 0.28624, "tier3": 0.37325},
+    7: {TIER1: 0.22765, TIER2: 0.28624, TIER3: 0.37325},
+    8: {TIER1: 0.22765, TIER2: 0.28624, TIER3: 0.37325},
+    9: {TIER1: 0.22765, TIER2: 0.28624, TIER3: 0.37325},
     # October - December (using previous year's rates as placeholder)
-    10: {"tier1": 0.21408, "tier2": 0.27267, "tier3": 0.27267},
-    11: {"tier1": 0.21408, "tier2": 0.27267, "tier3": 0.27267},
-    12: {"tier1": 0.21408, "tier2": 0.27267, "tier3": 0.27267},
+    10: {TIER1: 0.21408, TIER2: 0.27267, TIER3: 0.27267},
+    11: {TIER1: 0.21408, TIER2: 0.27267, TIER3: 0.27267},
+    12: {TIER1: 0.21408, TIER2: 0.27267, TIER3: 0.27267},
 }
 
 # For backward compatibility, maintain the old format as well
 STANDARD_RATES = {
     "summer": {  # June-September
-        "tier1": 0.21169,  # Tier 1 (0-350 kWh)
-        "tier2": 0.27028,  # Tier 2 (351-1050 kWh)
-        "tier3": 0.35729,  # Tier 3 (>1050 kWh)
+        TIER1: 0.21169,  # Tier 1 (0-350 kWh)
+        TIER2: 0.27028,  # Tier 2 (351-1050 kWh)
+        TIER3: 0.35729,  # Tier 3 (>1050 kWh)
     },
     "winter": {  # October-May
-        "tier1": 0.20042,  # Tier 1 (0-350 kWh)
-        "tier2": 0.25901,  # Tier 2 (351-1050 kWh)
-        "tier3": 0.25901,  # Tier 3 (>1050 kWh)
+        TIER1: 0.20042,  # Tier 1 (0-350 kWh)
+        TIER2: 0.25901,  # Tier 2 (351-1050 kWh)
+        TIER3: 0.25901,  # Tier 3 (>1050 kWh)
     },
     "tier1_limit": TIER1_LIMIT,
     "tier2_limit": TIER2_LIMIT,
@@ -150,58 +160,129 @@ STANDARD_RATES = {
 # Format: Year -> Month -> Rate Type
 TOU_RATES_2024 = {
     # January - March
-    1: {"high_peak": 0.22918, "low_peak": 0.22918, "base": 0.20564},
-    2: {"high_peak": 0.22918, "low_peak": 0.22918, "base": 0.20564},
-    3: {"high_peak": 0.22918, "low_peak": 0.22918, "base": 0.20564},
+    1: {HIGH_PEAK: 0.22918, LOW_PEAK: 0.22918, BASE: 0.20564},
+    2: {HIGH_PEAK: 0.22918, LOW_PEAK: 0.22918, BASE: 0.20564},
+    3: {HIGH_PEAK: 0.22918, LOW_PEAK: 0.22918, BASE: 0.20564},
     # April - May
-    4: {"high_peak": 0.22521, "low_peak": 0.22521, "base": 0.20167},
-    5: {"high_peak": 0.22521, "low_peak": 0.22521, "base": 0.20167},
+    4: {HIGH_PEAK: 0.22521, LOW_PEAK: 0.22521, BASE: 0.20167},
+    5: {HIGH_PEAK: 0.22521, LOW_PEAK: 0.22521, BASE: 0.20167},
     # June
-    6: {"high_peak": 0.28361, "low_peak": 0.22521, "base": 0.19777},
+    6: {HIGH_PEAK: 0.28361, LOW_PEAK: 0.22521, BASE: 0.19777},
     # July - September
-    7: {"high_peak": 0.29885, "low_peak": 0.24045, "base": 0.21301},
-    8: {"high_peak": 0.29885, "low_peak": 0.24045, "base": 0.21301},
-    9: {"high_peak": 0.29885, "low_peak": 0.24045, "base": 0.21301},
+    7: {HIGH_PEAK: 0.29885, LOW_PEAK: 0.24045, BASE: 0.21301},
+    8: {HIGH_PEAK: 0.29885, LOW_PEAK: 0.24045, BASE: 0.21301},
+    9: {HIGH_PEAK: 0.29885, LOW_PEAK: 0.24045, BASE: 0.21301},
     # October - December
-    10: {"high_peak": 0.24284, "low_peak": 0.24284, "base": 0.21930},
-    11: {"high_peak": 0.24284, "low_peak": 0.24284, "base": 0.21930},
-    12: {"high_peak": 0.24284, "low_peak": 0.24284, "base": 0.21930},
+    10: {HIGH_PEAK: 0.24284, LOW_PEAK: 0.24284, BASE: 0.21930},
+    11: {HIGH_PEAK: 0.24284, LOW_PEAK: 0.24284, BASE: 0.21930},
+    12: {HIGH_PEAK: 0.24284, LOW_PEAK: 0.24284, BASE: 0.21930},
 }
 
 TOU_RATES_2025 = {
     # January - March
-    1: {"high_peak": 0.25172, "low_peak": 0.25172, "base": 0.22818},
-    2: {"high_peak": 0.25172, "low_peak": 0.25172, "base": 0.22818},
-    3: {"high_peak": 0.25172, "low_peak": 0.25172, "base": 0.22818},
+    1: {HIGH_PEAK: 0.25172, LOW_PEAK: 0.25172, BASE: 0.22818},
+    2: {HIGH_PEAK: 0.25172, LOW_PEAK: 0.25172, BASE: 0.22818},
+    3: {HIGH_PEAK: 0.25172, LOW_PEAK: 0.25172, BASE: 0.22818},
     # April - May
-    4: {"high_peak": 0.25641, "low_peak": 0.25641, "base": 0.23287},
-    5: {"high_peak": 0.25641, "low_peak": 0.25641, "base": 0.23287},
+    4: {HIGH_PEAK: 0.25641, LOW_PEAK: 0.25641, BASE: 0.23287},
+    5: {HIGH_PEAK: 0.25641, LOW_PEAK: 0.25641, BASE: 0.23287},
     # June
-    6: {"high_peak": 0.31481, "low_peak": 0.25641, "base": 0.22897},
+    6: {HIGH_PEAK: 0.31481, LOW_PEAK: 0.25641, BASE: 0.22897},
     # July - September (using June rates as placeholder until actual rates are available)
-    7: {"high_peak": 0.31481, "low_peak": 0.25641, "base": 0.22897},
-    8: {"high_peak": 0.31481, "low_peak": 0.25641, "base": 0.22897},
-    9: {"high_peak": 0.31481, "low_peak": 0.25641, "base": 0.22897},
+    7: {HIGH_PEAK: 0.31481, LOW_PEAK: 0.25641, BASE: 0.22897},
+    8: {HIGH_PEAK: 0.31481, LOW_PEAK: 0.25641, BASE: 0.22897},
+    9: {HIGH_PEAK: 0.31481, LOW_PEAK: 0.25641, BASE: 0.22897},
     # October - December (using previous year's rates as placeholder)
-    10: {"high_peak": 0.24284, "low_peak": 0.24284, "base": 0.21930},
-    11: {"high_peak": 0.24284, "low_peak": 0.24284, "base": 0.21930},
-    12: {"high_peak": 0.24284, "low_peak": 0.24284, "base": 0.21930},
+    10: {HIGH_PEAK: 0.24284, LOW_PEAK: 0.24284, BASE: 0.21930},
+    11: {HIGH_PEAK: 0.24284, LOW_PEAK: 0.24284, BASE: 0.21930},
+    12: {HIGH_PEAK: 0.24284, LOW_PEAK: 0.24284, BASE: 0.21930},
 }
 
 # For backward compatibility, maintain the old format as well
 TOU_RATES = {
     "winter": {  # January-May, October-December
-        "high_peak": 0.22918,
-        "low_peak": 0.22918,
-        "base": 0.20564,
+        HIGH_PEAK: 0.22918,
+        LOW_PEAK: 0.22918,
+        BASE: 0.20564,
     },
     "summer": {  # June-September
-        "high_peak": 0.29885,
-        "low_peak": 0.24045,
-        "base": 0.21301,
+        HIGH_PEAK: 0.29885,
+        LOW_PEAK: 0.24045,
+        BASE: 0.21301,
     },
 }
 
+# Flattened rate tables built once at import from the literals above
+# (year, month) -> rates ordered as STANDARD_TIERS / TOU_PERIODS
+STANDARD_TIERS = (TIER1, TIER2, TIER3)
+TOU_PERIODS = (BASE, LOW_PEAK, HIGH_PEAK)
+
+STANDARD_RATES_FLAT = {
+    (year, month): tuple(tiers[tier] for tier in STANDARD_TIERS)
+    for year, rates in ((2024, STANDARD_RATES_2024), (2025, STANDARD_RATES_2025))
+    for month, tiers in rates.items()
+}
+TOU_RATES_FLAT = {
+    (year, month): tuple(periods[period] for period in TOU_PERIODS)
+    for year, rates in ((2024, TOU_RATES_2024), (2025, TOU_RATES_2025))
+    for month, periods in rates.items()
+}
+
+RATE_YEARS = (2024, 2025)
+
+
+def _season(month: int) -> str:
+    """Return the legacy season key for a month."""
+    return "summer" if SUMMER_START_MONTH <= month <= SUMMER_END_MONTH else "winter"
+
+
+@lru_cache(maxsize=256)
+def standard_rate(year: int, month: int, tier: str) -> float:
+    """Return the Standard (R-1A) rate for a year, month and tier."""
+    if year < RATE_YEARS[0]:
+        # For years before 2024, use the legacy seasonal rates
+        return STANDARD_RATES[_season(month)][tier]
+    # Years after the latest published table reuse the latest rates
+    rates = STANDARD_RATES_FLAT[(min(year, RATE_YEARS[-1]), month)]
+    return rates[STANDARD_TIERS.index(tier)]
+
+
+@lru_cache(maxsize=256)
+def tou_rate(year: int, month: int, period: str) -> float:
+    """Return the Time of Use (R-1B) rate for a year, month and period."""
+    if year < RATE_YEARS[0]:
+        # For years before 2024, use the legacy seasonal rates
+        return TOU_RATES[_season(month)][period]
+    # Years after the latest published table reuse the latest rates
+    rates = TOU_RATES_FLAT[(min(year, RATE_YEARS[-1]), month)]
+    return rates[TOU_PERIODS.index(period)]
+
+
+def tou_period(month: int, weekday: int, at: time) -> str:
+    """Determine the time period (high_peak, low_peak, base) for a month, weekday and time."""
+    # Weekend is always base period
+    if weekday >= 5:  # 5=Saturday, 6=Sunday
+        return BASE
+
+    # Check if in summer season (June-September)
+    if SUMMER_START_MONTH <= month <= SUMMER_END_MONTH:
+        # Summer High Peak: 1pm-5pm weekdays
+        if HIGH_PEAK_START <= at < HIGH_PEAK_END:
+            return HIGH_PEAK
+        # Summer Low Peak: 10am-1pm, 5pm-8pm weekdays
+        if (LOW_PEAK_SUMMER_MORNING_START <= at < LOW_PEAK_SUMMER_MORNING_END or
+                LOW_PEAK_SUMMER_EVENING_START <= at < LOW_PEAK_SUMMER_EVENING_END):
+            return LOW_PEAK
+        # All other times are base period
+        return BASE
+
+    # Winter Low Peak: 10am-8pm weekdays
+    if LOW_PEAK_WINTER_START <= at < LOW_PEAK_WINTER_END:
+        return LOW_PEAK
+    # All other times are base period
+    return BASE
+
+
 # Net Metering Credit Rate (when sending power back to grid)
 # Using the base rate for simplicity
 NET_METERING_CREDIT_RATE = 0.1974
@@ -4,47 +4,50 @@ from __future__ import annotations
 from typing import Any
 
 from homeassistant.components.diagnostics import async_redact_data
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_ENTITY_ID
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
 
-from .const import DOMAIN, CONF_GRID_POWER_ENTITY, CONF_SOLAR_POWER_ENTITY, CONF_LOAD_POWER_ENTITY
+from .const import CONF_GRID_POWER_ENTITY, CONF_SOLAR_POWER_ENTITY, CONF_LOAD_POWER_ENTITY
 
-TO_REDACT = {CONF_GRID_POWER_ENTITY, CONF_SOLAR_POWER_ENTITY, CONF_LOAD_POWER_ENTITY}
+TO_REDACT = frozenset({CONF_GRID_POWER_ENTITY, CONF_SOLAR_POWER_ENTITY, CONF_LOAD_POWER_ENTITY})
+UNAVAILABLE_STATES = ("unknown", "unavailable")
 
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
-    data = {}
+    # Add registered entities from the integration
+    entity_reg = er.async_get(hass)
+    registered_entities = [
+        {
+            "entity_id": entity.entity_id,
+            "unique_id": entity.unique_id,
+            "device_id": entity.device_id,
+        }
+        for entity in er.async_entries_for_config_entry(entity_reg, entry.entry_id)
+    ]
     
-    # Get integration data
-    if entry.entry_id in hass.data.get(DOMAIN, {}):
-        data["config"] = async_redact_data(dict(entry.data), TO_REDACT)
-        
-        # Add entity availability info
-        data["entities"] = {}
-        for entity_id in [
-            entry.data.get(CONF_GRID_POWER_ENTITY),
-            entry.data.get(CONF_SOLAR_POWER_ENTITY),
-            entry.data.get(CONF_LOAD_POWER_ENTITY),
-        ]:
-            if entity_id:
-                state = hass.states.get(entity_id)
-                data["entities"][entity_id] = {
-                    "available": state is not None and state.state not in ("unknown", "unavailable"),
-                    "state": state.state if state else "not_found",
-                }
+    # Integration data is only available while the entry is loaded
+    if entry.state is not ConfigEntryState.LOADED:
+        return {"registered_entities": registered_entities}
     
-    # Add registered entities from the integration
-    data["registered_entities"] = []
-    entity_reg = hass.helpers.entity_registry.async_get(hass)
-    for entity in entity_reg.entities.values():
-        if entity.config_entry_id == entry.entry_id:
-            data["registered_entities"].append({
-                "entity_id": entity.entity_id,
-                "unique_id": entity.unique_id,
-                "device_id": entity.device_id,
-            })
+    config = entry.runtime_data.config
+    
+    # Add entity availability info
+    entities = {}
+    states_get = hass.states.get
+    for key in (CONF_GRID_POWER_ENTITY, CONF_SOLAR_POWER_ENTITY, CONF_LOAD_POWER_ENTITY):
+        entity_id = config.get(key)
+        if entity_id:
+            state = states_get(entity_id)
+            entities[entity_id] = {
+                "available": state is not None and state.state not in UNAVAILABLE_STATES,
+                "state": state.state if state else "not_found",
+            }
     
-    return data 
\ No newline at end of file
+    return {
+        "config": async_redact_data(config, TO_REDACT),
+        "entities": entities,
+        "registered_entities": registered_entities,
+    }
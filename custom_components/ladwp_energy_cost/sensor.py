@@ -1,22 +1,29 @@
 """LADWP Energy Cost Calculator sensor implementation."""
+import calendar
 import logging
+import math
+from collections import deque
 from datetime import datetime, timedelta
-from decimal import Decimal
 from typing import Any, Dict, List, Optional, Tuple
 
-import voluptuous as vol
-
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.history import get_significant_states
+from homeassistant.components.recorder.statistics import statistics_during_period
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfEnergy, UnitOfPower, CONF_NAME
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.entity import EntityCategory, DeviceInfo
+from homeassistant.const import UnitOfEnergy, CONF_NAME
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.event import (
+    async_track_state_change_event,
+    async_track_time_interval,
+)
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
 from homeassistant.helpers.device_registry import DeviceEntryType
@@ -30,32 +37,23 @@ from .const import (
     CONF_BILLING_DAY,
     DEFAULT_NAME,
     DEFAULT_BILLING_DAY,
-    RATE_PLAN_STANDARD,
     RATE_PLAN_TIME_OF_USE,
-    SUMMER_START_MONTH,
-    SUMMER_END_MONTH,
-    HIGH_PEAK_START,
-    HIGH_PEAK_END,
-    LOW_PEAK_SUMMER_MORNING_START,
-    LOW_PEAK_SUMMER_MORNING_END,
-    LOW_PEAK_SUMMER_EVENING_START,
-    LOW_PEAK_SUMMER_EVENING_END,
-    LOW_PEAK_WINTER_START,
-    LOW_PEAK_WINTER_END,
-    STANDARD_RATES,
-    TOU_RATES,
-    TOU_RATES_2024,
-    TOU_RATES_2025,
     NET_METERING_CREDIT_RATE,
-    STANDARD_RATES_2024,
-    STANDARD_RATES_2025,
-    TIER1_LIMIT,
-    TIER2_LIMIT,
     DEFAULT_ZONE,
     DEFAULT_BILLING_PERIOD,
-    TIER_LIMITS,
+    TIER_LIMITS_FLAT,
     CONF_ZONE,
     CONF_BILLING_PERIOD,
+    HIGH_PEAK,
+    LOW_PEAK,
+    BASE,
+    TIER1,
+    TIER2,
+    TIER3,
+    TOU_PERIODS,
+    standard_rate,
+    tou_period,
+    tou_rate,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -92,25 +90,134 @@ ATTR_BASE_KWH_CONSUMED = "base_kwh_consumed"
 ATTR_TOTAL_KWH_CONSUMED = "total_kwh_consumed"
 ATTR_LOAD_COST = "load_cost"
 
-# Update interval (every minute)
-UPDATE_INTERVAL = timedelta(minutes=1)
+# Time of use periods, in the order sensors are created
+PERIODS = (HIGH_PEAK, LOW_PEAK, BASE)
+
+# Data keys of each period: (delivered, received, net, cost, generated, consumed)
+PERIOD_KEYS = {
+    HIGH_PEAK: (
+        ATTR_HIGH_PEAK_KWH_DELIVERED,
+        ATTR_HIGH_PEAK_KWH_RECEIVED,
+        ATTR_HIGH_PEAK_KWH_NET,
+        ATTR_HIGH_PEAK_COST,
+        ATTR_HIGH_PEAK_KWH_GENERATED,
+        ATTR_HIGH_PEAK_KWH_CONSUMED,
+    ),
+    LOW_PEAK: (
+        ATTR_LOW_PEAK_KWH_DELIVERED,
+        ATTR_LOW_PEAK_KWH_RECEIVED,
+        ATTR_LOW_PEAK_KWH_NET,
+        ATTR_LOW_PEAK_COST,
+        ATTR_LOW_PEAK_KWH_GENERATED,
+        ATTR_LOW_PEAK_KWH_CONSUMED,
+    ),
+    BASE: (
+        ATTR_BASE_KWH_DELIVERED,
+        ATTR_BASE_KWH_RECEIVED,
+        ATTR_BASE_KWH_NET,
+        ATTR_BASE_COST,
+        ATTR_BASE_KWH_GENERATED,
+        ATTR_BASE_KWH_CONSUMED,
+    ),
+}
+
+# Per-period sensors of each power entity:
+# (metric, name, index into PERIOD_KEYS, device class, state class, icon)
+GRID_PERIOD_SENSORS = (
+    (
+        "delivered", "Energy Delivered", 0,
+        SensorDeviceClass.ENERGY, SensorStateClass.TOTAL_INCREASING, "mdi:transmission-tower-export",
+    ),
+    (
+        "received", "Energy Received", 1,
+        SensorDeviceClass.ENERGY, SensorStateClass.TOTAL_INCREASING, "mdi:transmission-tower-import",
+    ),
+    ("net", "Net Energy", 2, SensorDeviceClass.ENERGY, SensorStateClass.TOTAL, "mdi:power-plug"),
+    ("cost", "Cost", 3, SensorDeviceClass.MONETARY, SensorStateClass.TOTAL, "mdi:cash"),
+)
+SOLAR_PERIOD_SENSORS = (
+    (
+        "solar", "Solar Generation", 4,
+        SensorDeviceClass.ENERGY, SensorStateClass.TOTAL_INCREASING, "mdi:solar-power",
+    ),
+)
+LOAD_PERIOD_SENSORS = (
+    (
+        "load", "Load Consumption", 5,
+        SensorDeviceClass.ENERGY, SensorStateClass.TOTAL_INCREASING, "mdi:home-lightning-bolt",
+    ),
+)
+
+# Billing cycle total sensors of each power entity:
+# (unique id key, name, data key, device class, state class, icon)
+GRID_TOTAL_SENSORS = (
+    (
+        "total_delivered", "Total Energy Delivered", ATTR_TOTAL_KWH_DELIVERED,
+        SensorDeviceClass.ENERGY, SensorStateClass.TOTAL_INCREASING, "mdi:transmission-tower-export",
+    ),
+    (
+        "total_received", "Total Energy Received", ATTR_TOTAL_KWH_RECEIVED,
+        SensorDeviceClass.ENERGY, SensorStateClass.TOTAL_INCREASING, "mdi:transmission-tower-import",
+    ),
+    (
+        "total_net", "Total Net Energy", ATTR_TOTAL_KWH_NET,
+        SensorDeviceClass.ENERGY, SensorStateClass.TOTAL, "mdi:power-plug",
+    ),
+)
+SOLAR_TOTAL_SENSORS = (
+    (
+        "total_solar", "Total Solar Generation", ATTR_TOTAL_KWH_GENERATED,
+        SensorDeviceClass.ENERGY, SensorStateClass.TOTAL_INCREASING, "mdi:solar-power",
+    ),
+    (
+        "solar_savings", "Solar Savings", ATTR_SOLAR_COST_SAVINGS,
+        SensorDeviceClass.MONETARY, SensorStateClass.TOTAL, "mdi:cash-plus",
+    ),
+)
+LOAD_TOTAL_SENSORS = (
+    (
+        "total_load", "Total Load Consumption", ATTR_TOTAL_KWH_CONSUMED,
+        SensorDeviceClass.ENERGY, SensorStateClass.TOTAL_INCREASING, "mdi:home-lightning-bolt",
+    ),
+    (
+        "load_cost", "Load Cost", ATTR_LOAD_COST,
+        SensorDeviceClass.MONETARY, SensorStateClass.TOTAL, "mdi:cash-minus",
+    ),
+)
+
+# Resolution of the billing cycle table; periods and rates only change on the hour
+SECONDS_PER_SLOT = 3600
+
+# States of a power sensor that carry no reading
+UNAVAILABLE_STATES = frozenset({"unknown", "unavailable", "none", ""})
+
+# Fallback update interval, so billing cycle resets and period changes are
+# picked up while the power sensors are not reporting
+SAFETY_INTERVAL = timedelta(minutes=5)
+
+# Minimum time between sensor state writes while the power sensors are busy
+PUBLISH_COOLDOWN = 1.0
 
 # Conversion from W to kWh for 1 minute readings
 WATTS_TO_KWH_PER_MINUTE = 1 / 60 / 1000  # (60 min/hr * 1000 W/kW)
 
+# Conversion from W to kWh for 1 second of power
+WATTS_TO_KWH_PER_SECOND = 1 / 3600 / 1000  # (3600 s/hr * 1000 W/kW)
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up the LADWP Energy Cost sensor from a config entry."""
-    name = entry.data.get(CONF_NAME, DEFAULT_NAME)
-    grid_entity_id = entry.data.get(CONF_GRID_POWER_ENTITY)
-    solar_entity_id = entry.data.get(CONF_SOLAR_POWER_ENTITY)
-    load_entity_id = entry.data.get(CONF_LOAD_POWER_ENTITY)
-    rate_plan = entry.data.get(CONF_RATE_PLAN)
-    billing_day = int(entry.data.get(CONF_BILLING_DAY, DEFAULT_BILLING_DAY))
-    zone = entry.data.get(CONF_ZONE, DEFAULT_ZONE)
-    billing_period = entry.data.get(CONF_BILLING_PERIOD, DEFAULT_BILLING_PERIOD)
+    config = entry.runtime_data.config
+    name = config.get(CONF_NAME, DEFAULT_NAME)
+    grid_entity_id = config.get(CONF_GRID_POWER_ENTITY)
+    solar_entity_id = config.get(CONF_SOLAR_POWER_ENTITY)
+    load_entity_id = config.get(CONF_LOAD_POWER_ENTITY)
+    rate_plan = config.get(CONF_RATE_PLAN)
+    billing_day = int(config.get(CONF_BILLING_DAY, DEFAULT_BILLING_DAY))
+    zone = config.get(CONF_ZONE, DEFAULT_ZONE)
+    billing_period = config.get(CONF_BILLING_PERIOD, DEFAULT_BILLING_PERIOD)
 
     _LOGGER.debug(
         "Setting up LADWP Energy Cost sensor with: name=%s, grid=%s, solar=%s, load=%s, billing_day=%s", 
@@ -121,134 +228,68 @@ async def async_setup_entry(
         hass, name, grid_entity_id, solar_entity_id, load_entity_id, rate_plan, billing_day, zone, billing_period
     )
 
-    # Set up the coordinator (including loading historical data)
-    try:
-        # Load historical data but handle errors gracefully
-        await coordinator.async_setup()
-    except Exception as e:
-        _LOGGER.error("Error setting up coordinator: %s", str(e))
-        # Continue with setup even if historical data loading fails
-
     # Initial data fetch
     await coordinator.async_config_entry_first_refresh()
 
-    # Create all sensors
-    sensors = []
-    
     # Main cost sensor (total)
-    sensors.append(
+    sensors = [
         LADWPEnergyCostSensor(
-            coordinator, 
-            name, 
-            grid_entity_id, 
-            solar_entity_id, 
-            load_entity_id, 
-            rate_plan, 
+            coordinator,
+            name,
+            grid_entity_id,
+            solar_entity_id,
+            load_entity_id,
+            rate_plan,
             billing_day,
             zone,
-            billing_period
-        )
-    )
-    
-    # Add time period energy sensors
-    for period in ["high_peak", "low_peak", "base"]:
-        # Energy delivered (from grid to home)
-        sensors.append(
-            LADWPEnergyDeliveredSensor(
-                coordinator, name, grid_entity_id, period, "delivered"
-            )
-        )
-        
-        # Energy received (from home to grid)
-        sensors.append(
-            LADWPEnergyReceivedSensor(
-                coordinator, name, grid_entity_id, period, "received"
-            )
-        )
-        
-        # Net energy
-        sensors.append(
-            LADWPEnergyNetSensor(
-                coordinator, name, grid_entity_id, period, "net"
-            )
-        )
-        
-        # Period cost
-        sensors.append(
-            LADWPPeriodCostSensor(
-                coordinator, name, grid_entity_id, period, "cost"
-            )
-        )
-    
-    # Add total energy sensors
-    sensors.append(
-        LADWPTotalEnergySensor(
-            coordinator, name, grid_entity_id, "delivered"
-        )
-    )
-    
-    sensors.append(
-        LADWPTotalEnergySensor(
-            coordinator, name, grid_entity_id, "received"
-        )
-    )
-    
-    sensors.append(
-        LADWPTotalEnergySensor(
-            coordinator, name, grid_entity_id, "net"
-        )
-    )
-    
-    # Add solar sensors if solar entity is provided
-    if solar_entity_id:
-        for period in ["high_peak", "low_peak", "base"]:
-            sensors.append(
-                LADWPSolarGenerationSensor(
-                    coordinator, name, solar_entity_id, period
-                )
-            )
-        
-        # Total solar generation
-        sensors.append(
-            LADWPTotalSolarGenerationSensor(
-                coordinator, name, solar_entity_id
-            )
-        )
-        
-        # Solar cost savings
-        sensors.append(
-            LADWPSolarSavingsSensor(
-                coordinator, name, solar_entity_id
-            )
+            billing_period,
         )
+    ]
     
-    # Add load sensors if load entity is provided
-    if load_entity_id:
-        for period in ["high_peak", "low_peak", "base"]:
-            sensors.append(
-                LADWPLoadConsumptionSensor(
-                    coordinator, name, load_entity_id, period
-                )
-            )
-        
-        # Total load consumption
-        sensors.append(
-            LADWPTotalLoadConsumptionSensor(
-                coordinator, name, load_entity_id
+    # Add the per-period and total sensors of the grid, and of the solar and
+    # load entities if provided
+    for entity_id, period_sensors, total_sensors in (
+        (grid_entity_id, GRID_PERIOD_SENSORS, GRID_TOTAL_SENSORS),
+        (solar_entity_id, SOLAR_PERIOD_SENSORS, SOLAR_TOTAL_SENSORS),
+        (load_entity_id, LOAD_PERIOD_SENSORS, LOAD_TOTAL_SENSORS),
+    ):
+        if not entity_id:
+            continue
+        sensors.extend(
+            LADWPEnergyValueSensor(
+                coordinator,
+                name,
+                entity_id,
+                f"{period}_{metric}",
+                f"{period.replace('_', ' ').title()} {label}",
+                PERIOD_KEYS[period][index],
+                device_class,
+                state_class,
+                icon,
             )
+            for period in PERIODS
+            for metric, label, index, device_class, state_class, icon in period_sensors
         )
-        
-        # Load cost
-        sensors.append(
-            LADWPLoadCostSensor(
-                coordinator, name, load_entity_id
+        sensors.extend(
+            LADWPEnergyValueSensor(
+                coordinator, name, entity_id, key, label, data_key, device_class, state_class, icon
             )
+            for key, label, data_key, device_class, state_class, icon in total_sensors
         )
 
     _LOGGER.debug("Adding %d sensors to Home Assistant", len(sensors))
     async_add_entities(sensors)
     _LOGGER.debug("Sensors added to Home Assistant")
 
+    # Integrate on power changes instead of polling
+    coordinator.async_start_tracking()
+    entry.async_on_unload(coordinator.async_stop_tracking)
+
+    # Load historical data in the background so it does not hold up startup
+    entry.async_create_background_task(
+        hass, coordinator.async_setup(), name="ladwp_energy_cost_history"
+    )
+
 
 class LADWPEnergyDataCoordinator(DataUpdateCoordinator):
     """Class to manage fetching LADWP energy data."""
@@ -270,29 +311,77 @@ class LADWPEnergyDataCoordinator(DataUpdateCoordinator):
             hass,
             _LOGGER,
             name=f"{name} coordinator",
-            update_interval=UPDATE_INTERVAL,
+            update_interval=None,
         )
         self.hass = hass
         self.grid_entity_id = grid_entity_id
         self.solar_entity_id = solar_entity_id
         self.load_entity_id = load_entity_id
+        # Power entity ids as used in unique ids and device identifiers
+        self.entity_slugs = {
+            entity_id: entity_id.replace(".", "_")
+            for entity_id in (grid_entity_id, solar_entity_id, load_entity_id)
+            if entity_id
+        }
         self.rate_plan = rate_plan
         self.billing_day = int(billing_day)  # Convert to int to ensure it's an integer
         self.zone = zone
         self.billing_period = billing_period
         
+        # Tier limits based on zone and billing period, fixed for the coordinator's lifetime
+        self._tier1_limit, self._tier2_limit = TIER_LIMITS_FLAT[(zone, billing_period)]
+        
+        # Current tier and the (floor, ceiling] band of net consumption it covers
+        self._current_tier = TIER1
+        self._tier_floor = -math.inf
+        self._tier_ceiling = self._tier1_limit
+        
+        # Historical data covers everything before the coordinator started
+        self._history_end = dt_util.now()
+        
         # Calculate the start of the current billing cycle
-        self.last_reset = self._get_billing_cycle_start()
+        self.last_reset = self._get_billing_cycle_start(self._history_end)
+        self._next_reset = self._get_next_reset_time(self._history_end)
         
         # Initialize energy data
         self.data = self._init_energy_data()
         
-        # Track when we need to reset counters
-        self._unsub_tracking = None
+        # Rounded sum of the period costs, refreshed whenever a period cost changes
+        self.total_cost = 0.0
+        
+        # Live readings are integrated from the end of the historical data
+        self._last_sample_time = self._history_end
+        self._last_power = (None, None, None)
+        # Whether the grid sensor had no reading at the last sample
+        self._grid_unavailable = False
+        # Last parsed state object and value per entity; State objects are
+        # immutable and replaced on every change, so identity means unchanged
+        self._state_cache = {}
+        
+        # Unsubscribe callbacks for the state change and safety timer listeners
+        self._unsub_tracking = []
+        
+        # Coalesce bursts of power changes into one write of all the sensors
+        self._publish_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=PUBLISH_COOLDOWN,
+            immediate=True,
+            function=self._async_publish,
+        )
+        
+        # Period code (index into TOU_PERIODS) and (year, month) of every hour of the billing cycle
+        self._build_cycle_table()
+        
+        # (year, month, tier) the period costs were last computed with
+        self._cost_basis = None
+        # Periods whose costs are stale, and the month of the last sample;
+        # costs are brought up to date once per published update
+        self._dirty_periods = set()
+        self._cost_month = (self._history_end.year, self._history_end.month)
         
         # Initialize spike detection
-        self._power_history = {}  # Store last 10 power values for each entity
-        self._power_history_size = 10
+        self._power_history_size = 10  # Number of accepted values the statistics use
         self._spike_threshold = 5000  # Lower threshold for spike detection
         self._max_change_ratio = 5  # Maximum allowed change ratio (5x increase/decrease)
         self._min_valid_power = 0.1  # Minimum valid power value (100W)
@@ -300,12 +389,65 @@ class LADWPEnergyDataCoordinator(DataUpdateCoordinator):
     async def async_setup(self) -> None:
         """Set up the coordinator and load historical data."""
         # Initialize with past data from the current billing cycle
-        await self._load_historical_data()
+        try:
+            await self._load_historical_data()
+        except Exception as e:
+            _LOGGER.error("Error setting up coordinator: %s", str(e))
+            return
+
+        # Push the backfilled totals to the sensors
+        self.async_update_listeners()
+
+    @callback
+    def async_start_tracking(self) -> None:
+        """Integrate power whenever one of the power sensors changes."""
+        entity_ids = [
+            entity_id
+            for entity_id in (self.grid_entity_id, self.solar_entity_id, self.load_entity_id)
+            if entity_id
+        ]
+        self._unsub_tracking = [
+            async_track_state_change_event(self.hass, entity_ids, self._async_power_changed),
+            async_track_time_interval(self.hass, self._async_safety_update, SAFETY_INTERVAL),
+        ]
+
+    @callback
+    def async_stop_tracking(self) -> None:
+        """Stop listening for power changes."""
+        for unsub in self._unsub_tracking:
+            unsub()
+        self._unsub_tracking = []
+        self._publish_debouncer.async_shutdown()
+
+    @callback
+    def _async_power_changed(self, event: Event) -> None:
+        """Handle a state change of one of the power sensors."""
+        old_state = event.data.get("old_state")
+        new_state = event.data.get("new_state")
+        # Attribute-only updates leave the power, and therefore the energy, unchanged
+        if old_state is not None and new_state is not None and old_state.state == new_state.state:
+            return
+        # Integrate every change, but write the sensor states at most once per cooldown
+        if self._integrate(dt_util.now()):
+            self._publish_debouncer.async_schedule_call()
+
+    @callback
+    def _async_safety_update(self, now: datetime) -> None:
+        """Integrate the held power readings while the sensors are idle."""
+        # Skip the sensor writes when nothing was added, e.g. while the grid is unavailable
+        if self._integrate(dt_util.now()):
+            self._async_publish()
+
+    @callback
+    def _async_publish(self) -> None:
+        """Push the current totals to the sensors."""
+        self._update_costs()
+        self.async_set_updated_data(self.data)
 
     async def _load_historical_data(self) -> None:
         """Load historical data from entities since the beginning of the billing cycle."""
         start_time = self.last_reset
-        end_time = dt_util.now()
+        end_time = self._history_end
         
         _LOGGER.debug("Loading historical data from %s to %s", start_time, end_time)
         
@@ -315,16 +457,16 @@ class LADWPEnergyDataCoordinator(DataUpdateCoordinator):
             return
             
         try:
-            # Get history from start of billing cycle
-            grid_history = await self._get_entity_history(self.grid_entity_id, start_time, end_time)
-            solar_history = None
-            load_history = None
-            
-            if self.solar_entity_id:
-                solar_history = await self._get_entity_history(self.solar_entity_id, start_time, end_time)
-                
-            if self.load_entity_id:
-                load_history = await self._get_entity_history(self.load_entity_id, start_time, end_time)
+            # Get history from start of billing cycle for all power entities at once
+            entity_ids = [
+                entity_id
+                for entity_id in (self.grid_entity_id, self.solar_entity_id, self.load_entity_id)
+                if entity_id
+            ]
+            histories = await self._get_entities_history(entity_ids, start_time, end_time)
+            grid_history = histories.get(self.grid_entity_id)
+            solar_history = histories.get(self.solar_entity_id) if self.solar_entity_id else None
+            load_history = histories.get(self.load_entity_id) if self.load_entity_id else None
             
             if not grid_history:
                 _LOGGER.warning("No historical data found for grid entity: %s", self.grid_entity_id)
@@ -338,12 +480,11 @@ class LADWPEnergyDataCoordinator(DataUpdateCoordinator):
         except Exception as e:
             _LOGGER.exception("Error loading historical data: %s", str(e))
             
-    async def _get_entity_history(self, entity_id: str, start_time: datetime, end_time: datetime) -> List[dict]:
-        """Get historical states for an entity."""
-        from homeassistant.components.recorder import get_instance
-        from homeassistant.components.recorder.statistics import statistics_during_period
-        from homeassistant.components.recorder.models import StatisticMetaData
-        import homeassistant.util.dt as dt_util
+    async def _get_entities_history(
+        self, entity_ids: List[str], start_time: datetime, end_time: datetime
+    ) -> Dict[str, List[Any]]:
+        """Get historical statistics or states for several entities."""
+        histories = {}
         
         # First try to get high-resolution statistics if available (5min intervals)
         # This is the most accurate but might not be available for all entities
@@ -353,40 +494,43 @@ class LADWPEnergyDataCoordinator(DataUpdateCoordinator):
                 self.hass, 
                 start_time,
                 end_time, 
-                [entity_id], 
+                set(entity_ids), 
                 "5minute", 
                 None,
-                {"sum", "mean"}
+                {"mean"}
             )
-            
-            if stats and entity_id in stats and stats[entity_id]:
-                _LOGGER.debug("Found %d statistical data points for %s", len(stats[entity_id]), entity_id)
-                return stats[entity_id]
+            for entity_id in entity_ids:
+                # Power sensors have a mean; anything else needs the raw history
+                if stats and stats.get(entity_id) and stats[entity_id][0].get("mean") is not None:
+                    _LOGGER.debug("Found %d statistical data points for %s", len(stats[entity_id]), entity_id)
+                    histories[entity_id] = stats[entity_id]
         except Exception as e:
-            _LOGGER.debug("Could not get statistics for %s: %s", entity_id, str(e))
+            _LOGGER.debug("Could not get statistics for %s: %s", entity_ids, str(e))
+            
+        missing = [entity_id for entity_id in entity_ids if entity_id not in histories]
+        if not missing:
+            return histories
         
         # Fall back to getting raw history
-        from homeassistant.components.recorder import get_instance
-        from homeassistant.components.recorder.history import get_significant_states
-        
         # Get historical states
-        _LOGGER.debug("Falling back to raw history for %s", entity_id)
+        _LOGGER.debug("Falling back to raw history for %s", missing)
         history = await get_instance(self.hass).async_add_executor_job(
             get_significant_states,
             self.hass,
             start_time,
             end_time, 
-            [entity_id],
+            missing,
             None,
             True
         )
         
-        if entity_id not in history:
-            _LOGGER.warning("No history found for entity %s", entity_id)
-            return []
-            
-        _LOGGER.debug("Found %d historical states for %s", len(history[entity_id]), entity_id)
-        return history[entity_id]
+        for entity_id in missing:
+            if entity_id not in history:
+                _LOGGER.warning("No history found for entity %s", entity_id)
+                continue
+            _LOGGER.debug("Found %d historical states for %s", len(history[entity_id]), entity_id)
+            histories[entity_id] = history[entity_id]
+        return histories
         
     async def _process_historical_data(
         self, 
@@ -397,291 +541,249 @@ class LADWPEnergyDataCoordinator(DataUpdateCoordinator):
         """Process historical data and update energy calculations."""
         _LOGGER.debug("Processing %d historical entries for grid power", len(grid_history))
         
+        # Parse each history once and filter out spikes before accumulating
+        grid_powers = self._get_power_index(grid_history)
+        solar_powers = self._get_power_index(solar_history) if solar_history else {}
+        load_powers = self._get_power_index(load_history) if load_history else {}
+        
         # Process each time slice in sequence to properly track tier changes
-        # Need to sort by timestamp to ensure correct order
-        timestamps = self._get_sorted_timestamps(grid_history, solar_history, load_history)
+        timestamps = sorted(grid_powers.keys() | solar_powers.keys() | load_powers.keys())
         
         if not timestamps:
             _LOGGER.warning("No valid timestamps found in historical data")
             return
             
+        data = self.data
+        cycle_start = self._cycle_start_ts
+        cycle_periods = self._cycle_periods
+        cycle_months = self._cycle_months
+        time_of_use = self.rate_plan == RATE_PLAN_TIME_OF_USE
+        
+        # Per-period totals, indexed like TOU_PERIODS, written to the data once at the end
+        delivered = [0.0] * len(TOU_PERIODS)
+        received = [0.0] * len(TOU_PERIODS)
+        generated = [0.0] * len(TOU_PERIODS)
+        consumed = [0.0] * len(TOU_PERIODS)
+        solar_savings = 0.0
+        load_cost = 0.0
+        
+        # Running net consumption, which selects the standard plan tier
+        net_consumption = data[ATTR_TOTAL_KWH_DELIVERED] - data[ATTR_TOTAL_KWH_RECEIVED]
+        
+        # Each sample covers the time until the next one; the last sample is
+        # assumed to cover one 5 minute statistics interval
+        energy_factors = [
+            (next_timestamp - timestamp).total_seconds() * WATTS_TO_KWH_PER_SECOND
+            for timestamp, next_timestamp in zip(timestamps, timestamps[1:])
+        ]
+        energy_factors.append(5 * WATTS_TO_KWH_PER_MINUTE)
+        
         # Convert raw states to energy values
-        for i, timestamp in enumerate(timestamps):
+        for timestamp, energy_factor in zip(timestamps, energy_factors):
             # Get power values at this timestamp
-            grid_power = self._get_power_at_timestamp(grid_history, timestamp)
-            solar_power = self._get_power_at_timestamp(solar_history, timestamp) if solar_history else None
-            load_power = self._get_power_at_timestamp(load_history, timestamp) if load_history else None
+            grid_power = grid_powers.get(timestamp)
+            solar_power = solar_powers.get(timestamp)
+            load_power = load_powers.get(timestamp)
             
             if grid_power is None:
                 continue
                 
-            # Calculate energy based on distance to next timestamp
-            if i + 1 < len(timestamps):
-                next_timestamp = timestamps[i + 1]
-                # Ensure both are datetime objects
-                if isinstance(timestamp, datetime) and isinstance(next_timestamp, datetime):
-                    duration_minutes = (next_timestamp - timestamp).total_seconds() / 60
-                    watts_to_kwh = 1 / 60 / 1000  # Convert W to kWh for 1 minute
-                    energy_factor = duration_minutes * watts_to_kwh
-                else:
-                    # Default to 5 minutes for statistics data intervals
-                    energy_factor = 5 * WATTS_TO_KWH_PER_MINUTE
-            else:
-                # Last entry - use default 5 minute interval for statistics data
-                energy_factor = 5 * WATTS_TO_KWH_PER_MINUTE
-                
             # Determine time period for this timestamp
-            period = self._get_time_period(timestamp)
-            rate = self._get_rate(timestamp, period)
+            slot = int((timestamp.timestamp() - cycle_start) // SECONDS_PER_SLOT)
+            if not 0 <= slot < len(cycle_periods):
+                # Outside the current billing cycle
+                continue
+            code = cycle_periods[slot]
+            year, month = cycle_months[slot]
+            if time_of_use:
+                rate = tou_rate(year, month, TOU_PERIODS[code])
+            else:
+                rate = standard_rate(year, month, self._tier_for(net_consumption))
             
             # Update energy data
             # Grid energy
             grid_energy = grid_power * energy_factor
+            net_consumption += grid_energy
             if grid_energy > 0:  # Delivered from grid (consumption)
-                self.data[f"{period}_kwh_delivered"] += grid_energy
-                self.data[ATTR_TOTAL_KWH_DELIVERED] += grid_energy
+                delivered[code] += grid_energy
             else:  # Received by grid (excess solar)
-                received_energy = abs(grid_energy)
-                self.data[f"{period}_kwh_received"] += received_energy
-                self.data[ATTR_TOTAL_KWH_RECEIVED] += received_energy
+                received[code] -= grid_energy
                 
             # Solar energy
             if solar_power is not None:
                 solar_energy = solar_power * energy_factor
-                self.data[f"{period}_kwh_generated"] += solar_energy
-                self.data[ATTR_TOTAL_KWH_GENERATED] += solar_energy
-                self.data[ATTR_SOLAR_COST_SAVINGS] += solar_energy * rate
+                generated[code] += solar_energy
+                solar_savings += solar_energy * rate
                 
             # Load energy
             if load_power is not None:
                 load_energy = load_power * energy_factor
-                self.data[f"{period}_kwh_consumed"] += load_energy
-                self.data[ATTR_TOTAL_KWH_CONSUMED] += load_energy
-                self.data[ATTR_LOAD_COST] += load_energy * rate
+                consumed[code] += load_energy
+                load_cost += load_energy * rate
+                
+        for code, period in enumerate(TOU_PERIODS):
+            delivered_key, received_key, _, _, generated_key, consumed_key = PERIOD_KEYS[period]
+            data[delivered_key] += delivered[code]
+            data[received_key] += received[code]
+            if solar_history:
+                data[generated_key] += generated[code]
+            if load_history:
+                data[consumed_key] += consumed[code]
+        data[ATTR_TOTAL_KWH_DELIVERED] += sum(delivered)
+        data[ATTR_TOTAL_KWH_RECEIVED] += sum(received)
+        if solar_history:
+            data[ATTR_TOTAL_KWH_GENERATED] += sum(generated)
+            data[ATTR_SOLAR_COST_SAVINGS] += solar_savings
+        if load_history:
+            data[ATTR_TOTAL_KWH_CONSUMED] += sum(consumed)
+            data[ATTR_LOAD_COST] += load_cost
                 
         # Calculate net values and costs
-        self._update_net_values_and_costs(dt_util.now())
+        now = dt_util.now()
+        self._update_net_values_and_costs(now.year, now.month)
         
         _LOGGER.debug("Historical processing complete. Total delivered: %.2f kWh, Total received: %.2f kWh", 
-                    self.data[ATTR_TOTAL_KWH_DELIVERED], self.data[ATTR_TOTAL_KWH_RECEIVED])
+                    data[ATTR_TOTAL_KWH_DELIVERED], data[ATTR_TOTAL_KWH_RECEIVED])
     
-    def _update_net_values_and_costs(self, now: datetime) -> None:
+    def _update_net_values_and_costs(self, year: int, month: int) -> None:
         """Update net values and costs based on current data."""
         # Update net values and costs
-        for period in ["high_peak", "low_peak", "base"]:
-            delivered = self.data[f"{period}_kwh_delivered"]
-            received = self.data[f"{period}_kwh_received"]
-            net = delivered - received
-            
-            # Update net values
-            self.data[f"net_{period}_kwh"] = net
-            
-            # Calculate cost for this period
-            if net > 0:  # Net consumption
-                rate = self._get_rate(now, period)
-                self.data[f"{period}_cost"] = net * rate
-            else:  # Net production
-                # Credit for excess production at net metering rate
-                self.data[f"{period}_cost"] = net * NET_METERING_CREDIT_RATE
+        for period in PERIODS:
+            self._update_period_net_and_cost(year, month, period)
                 
         # Update total net
         self.data[ATTR_TOTAL_KWH_NET] = self.data[ATTR_TOTAL_KWH_DELIVERED] - self.data[ATTR_TOTAL_KWH_RECEIVED]
+        self._update_total_cost()
     
-    def _get_sorted_timestamps(
-        self, 
-        grid_history: List[dict], 
-        solar_history: Optional[List[dict]], 
-        load_history: Optional[List[dict]]
-    ) -> List[datetime]:
-        """Get a sorted list of all timestamps from the historical data."""
-        timestamps = set()
+    def _update_period_net_and_cost(self, year: int, month: int, period: str) -> None:
+        """Update the net value and cost of a single period."""
+        data = self.data
+        delivered_key, received_key, net_key, cost_key, _, _ = PERIOD_KEYS[period]
+        net = data[delivered_key] - data[received_key]
         
-        # Add grid timestamps
-        for state in grid_history:
-            if isinstance(state, dict) and "start" in state:
-                # Statistics data - ensure it's a datetime
-                if isinstance(state["start"], datetime):
-                    timestamps.add(state["start"])
-                else:
-                    # Try to convert if it's a string
-                    try:
-                        if isinstance(state["start"], str):
-                            timestamps.add(dt_util.parse_datetime(state["start"]))
-                    except (ValueError, TypeError):
-                        _LOGGER.debug("Couldn't convert timestamp: %s", state["start"])
-            elif hasattr(state, "last_updated"):
-                # State data
-                timestamps.add(state.last_updated)
-                
-        # Add solar timestamps
-        if solar_history:
-            for state in solar_history:
-                if isinstance(state, dict) and "start" in state:
-                    if isinstance(state["start"], datetime):
-                        timestamps.add(state["start"])
-                    else:
-                        try:
-                            if isinstance(state["start"], str):
-                                timestamps.add(dt_util.parse_datetime(state["start"]))
-                        except (ValueError, TypeError):
-                            _LOGGER.debug("Couldn't convert timestamp: %s", state["start"])
-                elif hasattr(state, "last_updated"):
-                    timestamps.add(state.last_updated)
-                    
-        # Add load timestamps
-        if load_history:
-            for state in load_history:
-                if isinstance(state, dict) and "start" in state:
-                    if isinstance(state["start"], datetime):
-                        timestamps.add(state["start"])
-                    else:
-                        try:
-                            if isinstance(state["start"], str):
-                                timestamps.add(dt_util.parse_datetime(state["start"]))
-                        except (ValueError, TypeError):
-                            _LOGGER.debug("Couldn't convert timestamp: %s", state["start"])
-                elif hasattr(state, "last_updated"):
-                    timestamps.add(state.last_updated)
-                    
-        # Filter out any non-datetime values
-        timestamps = {ts for ts in timestamps if isinstance(ts, datetime)}
-        
-        # Sort timestamps
-        return sorted(list(timestamps))
-        
-    def _is_spike(self, power_value: float, entity_id: str) -> bool:
-        """Detect if a power value is a spike using multiple methods.
+        # Update net values
+        data[net_key] = net
         
-        Args:
-            power_value: The power value to check
-            entity_id: The entity ID for tracking history
-            
-        Returns:
-            bool: True if the value is considered a spike
+        # Calculate cost for this period
+        if net > 0:  # Net consumption
+            rate = self._get_rate(year, month, period)
+            data[cost_key] = net * rate
+        else:  # Net production
+            # Credit for excess production at net metering rate
+            data[cost_key] = net * NET_METERING_CREDIT_RATE
+    
+    def _update_costs(self) -> None:
+        """Update net values and costs of the periods energy was added to."""
+        dirty = self._dirty_periods
+        if not dirty:
+            return
+        year, month = self._cost_month
+        # Costs of the other periods only move when their rate does, i.e. on a
+        # new month or, for the standard plan, a tier change
+        tier = self._get_tier() if self.rate_plan != RATE_PLAN_TIME_OF_USE else None
+        cost_basis = (year, month, tier)
+        if cost_basis != self._cost_basis:
+            self._cost_basis = cost_basis
+            self._update_net_values_and_costs(year, month)
+        else:
+            for period in dirty:
+                self._update_period_net_and_cost(year, month, period)
+            self.data[ATTR_TOTAL_KWH_NET] = self.data[ATTR_TOTAL_KWH_DELIVERED] - self.data[ATTR_TOTAL_KWH_RECEIVED]
+            self._update_total_cost()
+        dirty.clear()
+    
+    def _update_total_cost(self) -> None:
+        """Update the rounded total cost from the period costs."""
+        data = self.data
+        self.total_cost = round(
+            data[ATTR_HIGH_PEAK_COST] + data[ATTR_LOW_PEAK_COST] + data[ATTR_BASE_COST],
+            2,
+        )
+    
+    def _get_power_series(self, history: List[Any]) -> List[Tuple[datetime, Optional[float]]]:
+        """Get the (timestamp, power) samples of a statistics or state history.
+
+        Samples without a numeric value keep their timestamp with a power of None.
         """
-        # Initialize history for this entity if not exists
-        if entity_id not in self._power_history:
-            self._power_history[entity_id] = []
-            
-        history = self._power_history[entity_id]
-        
-        # Method 1: Basic threshold check
-        if abs(power_value) > self._spike_threshold:
-            _LOGGER.debug(
-                "Spike detected by threshold: %f > %f for %s",
-                abs(power_value), self._spike_threshold, entity_id
-            )
-            return True
-            
-        # Method 2: Statistical analysis (if we have enough history)
-        if len(history) >= 3:
-            # Calculate mean and standard deviation
-            mean = sum(history) / len(history)
-            std_dev = (sum((x - mean) ** 2 for x in history) / len(history)) ** 0.5
-            
-            # If value is more than 3 standard deviations from mean
-            if abs(power_value - mean) > 3 * std_dev and std_dev > 0:
-                _LOGGER.debug(
-                    "Spike detected by statistical analysis: %f is %f std devs from mean %f for %s",
-                    power_value, abs(power_value - mean) / std_dev, mean, entity_id
-                )
-                return True
-                
-        # Method 3: Sudden change detection
-        if history:
-            last_value = history[-1]
-            if abs(last_value) > self._min_valid_power and abs(power_value) > self._min_valid_power:
-                change_ratio = abs(power_value / last_value)
-                if change_ratio > self._max_change_ratio or change_ratio < 1/self._max_change_ratio:
-                    _LOGGER.debug(
-                        "Spike detected by change ratio: %f (ratio: %f) for %s",
-                        power_value, change_ratio, entity_id
-                    )
-                    return True
-                    
-        # Update history
-        history.append(power_value)
-        if len(history) > self._power_history_size:
-            history.pop(0)
-            
-        return False
-        
-    def _get_power_at_timestamp(self, history: Optional[List[dict]], timestamp: datetime) -> Optional[float]:
-        """Get the power value at a specific timestamp from history."""
-        if not history:
-            return None
-            
-        # Track the last valid (non-spike) power value
-        last_valid_power = None
-            
-        # Check if it's statistics data
-        if isinstance(history[0], dict) and "start" in history[0]:
-            # Find statistics entry with matching timestamp
-            for entry in history:
-                if not isinstance(entry, dict) or "start" not in entry:
-                    continue
-                    
-                entry_timestamp = entry.get("start")
-                # Handle different timestamp formats
-                if not isinstance(entry_timestamp, datetime) and isinstance(entry_timestamp, str):
+        series = []
+        for entry in history:
+            if isinstance(entry, dict) and "start" in entry:
+                # Statistics data
+                timestamp = entry["start"]
+                if isinstance(timestamp, (int, float)):
+                    # Recent recorders report the start as a UTC epoch
+                    timestamp = dt_util.utc_from_timestamp(timestamp)
+                elif isinstance(timestamp, str):
                     try:
-                        entry_timestamp = dt_util.parse_datetime(entry_timestamp)
+                        timestamp = dt_util.parse_datetime(timestamp)
                     except (ValueError, TypeError):
                         continue
-                        
-                if entry_timestamp == timestamp:
-                    power_value = None
-                    if "mean" in entry and entry["mean"] is not None:
-                        try:
-                            power_value = float(entry["mean"])
-                        except (ValueError, TypeError):
-                            pass
-                    elif "sum" in entry and entry["sum"] is not None:
-                        try:
-                            power_value = float(entry["sum"])
-                        except (ValueError, TypeError):
-                            pass
-                    elif "state" in entry and entry["state"] is not None:
+                if not isinstance(timestamp, datetime):
+                    continue
+                power = None
+                for field in ("mean", "sum", "state"):
+                    if entry.get(field) is not None:
                         try:
-                            power_value = float(entry["state"])
+                            power = float(entry[field])
                         except (ValueError, TypeError):
                             pass
-                            
-                    if power_value is not None:
-                        # Get entity ID from history
-                        entity_id = entry.get("entity_id", "unknown")
-                        if not self._is_spike(power_value, entity_id):
-                            last_valid_power = power_value
-                            return power_value
-                        else:
-                            _LOGGER.debug(
-                                "Detected spike value %f at %s for %s, using last valid value %f",
-                                power_value, timestamp, entity_id, last_valid_power if last_valid_power is not None else 0
-                            )
-                            return last_valid_power if last_valid_power is not None else 0
-            return None
+                        break
+                series.append((timestamp, power))
+            elif hasattr(entry, "last_updated"):
+                # State data
+                try:
+                    power = float(entry.state)
+                except (ValueError, TypeError):
+                    power = None
+                series.append((entry.last_updated, power))
+        return series
+
+    def _clean_spikes(
+        self, series: List[Tuple[datetime, Optional[float]]]
+    ) -> List[Tuple[datetime, Optional[float]]]:
+        """Replace spikes in a time ordered power series with the last valid value.
+
+        A value is a spike if it exceeds the absolute threshold, lies more than
+        three standard deviations from the recently accepted values, or changes
+        by more than the maximum ratio from the last accepted value.
+        """
+        cleaned = []
+        window = deque(maxlen=self._power_history_size)  # Recently accepted values
+        last_valid = 0.0
+        for timestamp, power in series:
+            if power is None:
+                cleaned.append((timestamp, None))
+                continue
+            spike = abs(power) > self._spike_threshold
+            if not spike and len(window) >= 3:
+                # Two passes over at most _power_history_size values; running
+                # sums drift and would give a flat window a non-zero spread
+                mean = sum(window) / len(window)
+                std_dev = math.sqrt(sum((x - mean) ** 2 for x in window) / len(window))
+                spike = std_dev > 0 and abs(power - mean) > 3 * std_dev
+            if not spike and window:
+                if abs(last_valid) > self._min_valid_power and abs(power) > self._min_valid_power:
+                    change_ratio = abs(power / last_valid)
+                    spike = change_ratio > self._max_change_ratio or change_ratio < 1 / self._max_change_ratio
             
-        # If it's state data
-        for state in history:
-            if not hasattr(state, "last_updated"):
+            if spike:
+                _LOGGER.debug(
+                    "Detected spike value %f at %s, using last valid value %f",
+                    power, timestamp, last_valid
+                )
+                cleaned.append((timestamp, last_valid))
                 continue
                 
-            if state.last_updated == timestamp:
-                try:
-                    power_value = float(state.state)
-                    entity_id = state.entity_id if hasattr(state, "entity_id") else "unknown"
-                    if not self._is_spike(power_value, entity_id):
-                        last_valid_power = power_value
-                        return power_value
-                    else:
-                        _LOGGER.debug(
-                            "Detected spike value %f at %s for %s, using last valid value %f",
-                            power_value, timestamp, entity_id, last_valid_power if last_valid_power is not None else 0
-                        )
-                        return last_valid_power if last_valid_power is not None else 0
-                except (ValueError, TypeError):
-                    return None
-        return None
+            cleaned.append((timestamp, power))
+            last_valid = power
+            window.append(power)
+        return cleaned
+        
+    def _get_power_index(self, history: List[Any]) -> Dict[datetime, Optional[float]]:
+        """Get the spike filtered power of a history keyed by timestamp."""
+        series = self._clean_spikes(self._get_power_series(history))
+        # Reversed so the first sample wins when a timestamp repeats
+        return dict(reversed(series))
 
     def _init_energy_data(self) -> Dict[str, Any]:
         """Initialize energy data structure."""
@@ -725,10 +827,13 @@ class LADWPEnergyDataCoordinator(DataUpdateCoordinator):
             
         return data
 
-    def _get_billing_cycle_start(self) -> datetime:
-        """Get the start of the current billing cycle."""
-        now = dt_util.now()
-        billing_day = int(self.billing_day)  # Ensure billing_day is an integer
+    def _get_billing_day(self, year: int, month: int) -> int:
+        """Get the billing day of a month, clamped to the month's last day."""
+        return min(int(self.billing_day), calendar.monthrange(year, month)[1])
+
+    def _get_billing_cycle_start(self, now: datetime) -> datetime:
+        """Get the start of the billing cycle containing now."""
+        billing_day = self._get_billing_day(now.year, now.month)
         
         if now.day >= billing_day:
             # Current billing cycle started this month
@@ -740,169 +845,210 @@ class LADWPEnergyDataCoordinator(DataUpdateCoordinator):
             last_month = now.month - 1 if now.month > 1 else 12
             last_month_year = now.year if now.month > 1 else now.year - 1
             return dt_util.start_of_local_day(
-                datetime(last_month_year, last_month, billing_day)
+                datetime(
+                    last_month_year,
+                    last_month,
+                    self._get_billing_day(last_month_year, last_month),
+                )
             )
 
-    def _is_summer_season(self, date: datetime) -> bool:
-        """Check if the date is in the summer season (June-September)."""
-        return SUMMER_START_MONTH <= date.month <= SUMMER_END_MONTH
-
-    def _get_time_period(self, date: datetime) -> str:
-        """Determine the time period (high_peak, low_peak, base) for the given date."""
-        # Weekend is always base period
-        if date.weekday() >= 5:  # 5=Saturday, 6=Sunday
-            return "base"
-            
-        # Get current time without date
-        current_time = date.time()
-        
-        # Check if in summer season (June-September)
-        if self._is_summer_season(date):
-            # Summer High Peak: 1pm-5pm weekdays
-            if HIGH_PEAK_START <= current_time < HIGH_PEAK_END:
-                return "high_peak"
-            # Summer Low Peak: 10am-1pm, 5pm-8pm weekdays
-            elif (LOW_PEAK_SUMMER_MORNING_START <= current_time < LOW_PEAK_SUMMER_MORNING_END or
-                  LOW_PEAK_SUMMER_EVENING_START <= current_time < LOW_PEAK_SUMMER_EVENING_END):
-                return "low_peak"
-            # All other times are base period
-            else:
-                return "base"
-        else:
-            # Winter Low Peak: 10am-8pm weekdays
-            if LOW_PEAK_WINTER_START <= current_time < LOW_PEAK_WINTER_END:
-                return "low_peak"
-            # All other times are base period
+    def _build_cycle_table(self) -> None:
+        """Precompute the time period and month of every hour of the billing cycle."""
+        # Step in absolute time so daylight saving changes keep slots one hour long.
+        # Timestamps, because subtracting local times that share a tzinfo gives
+        # the wall clock difference.
+        start = dt_util.as_utc(self.last_reset)
+        self._cycle_start_ts = start.timestamp()
+        slots = int(self._next_reset.timestamp() - self._cycle_start_ts) // SECONDS_PER_SLOT
+        periods = bytearray(slots)
+        months = []
+        for slot in range(slots):
+            moment = dt_util.as_local(start + timedelta(seconds=slot * SECONDS_PER_SLOT))
+            periods[slot] = TOU_PERIODS.index(tou_period(moment.month, moment.weekday(), moment.time()))
+            months.append((moment.year, moment.month))
+        self._cycle_periods = bytes(periods)
+        self._cycle_months = months
+
+    def _get_cycle_slot(self, moment: datetime) -> int:
+        """Get the index of the billing cycle hour containing moment."""
+        return int((moment.timestamp() - self._cycle_start_ts) // SECONDS_PER_SLOT)
+
+    def _get_tier(self) -> str:
+        """Get the standard plan tier for the consumption so far this billing cycle."""
+        # Get the total consumption for this billing cycle so far
+        data = self.data
+        return self._tier_for(data[ATTR_TOTAL_KWH_DELIVERED] - data[ATTR_TOTAL_KWH_RECEIVED])
+
+    def _tier_for(self, total_consumption: float) -> str:
+        """Get the standard plan tier for a net consumption total."""
+        # The tier only changes when consumption leaves the current band, which
+        # can happen in either direction as exports lower the net total
+        if not self._tier_floor < total_consumption <= self._tier_ceiling:
+            if total_consumption <= self._tier1_limit:
+                self._current_tier = TIER1
+                self._tier_floor, self._tier_ceiling = -math.inf, self._tier1_limit
+            elif total_consumption <= self._tier2_limit:
+                self._current_tier = TIER2
+                self._tier_floor, self._tier_ceiling = self._tier1_limit, self._tier2_limit
             else:
-                return "base"
-
-    def _get_rate(self, date: datetime, period: str) -> float:
-        """Get the rate for the given date and period."""
-        # Get current year and month
-        year = date.year
-        month = date.month
-        season = "summer" if self._is_summer_season(date) else "winter"
-        
+                self._current_tier = TIER3
+                self._tier_floor, self._tier_ceiling = self._tier2_limit, math.inf
+        return self._current_tier
+
+    def _get_rate(self, year: int, month: int, period: str) -> float:
+        """Get the rate for the given year, month and period."""
         if self.rate_plan == RATE_PLAN_TIME_OF_USE:
-            # Use year-specific rates when available
-            if year == 2024:
-                # Use 2024 specific rates
-                return TOU_RATES_2024[month][period]
-            elif year == 2025:
-                # Use 2025 specific rates
-                return TOU_RATES_2025[month][period]
-            else:
-                # Fallback to seasonal rates for other years
-                # Use latest known rates (2025 for now)
-                # First try to get the month-specific rate from the latest year
-                if year > 2025:
-                    return TOU_RATES_2025[month][period]
-                else:
-                    # For years before 2024, use the legacy seasonal rates
-                    return TOU_RATES[season][period]
-        else:
-            # For standard rates (R-1A), determine tier based on total usage and zone/billing period
-            # Get the total consumption for this billing cycle so far
-            total_consumption = self.data[ATTR_TOTAL_KWH_DELIVERED] - self.data[ATTR_TOTAL_KWH_RECEIVED]
-            
-            # Get tier limits based on zone and billing period
-            tier1_limit = TIER_LIMITS[self.zone][self.billing_period]["tier1_limit"]
-            tier2_limit = TIER_LIMITS[self.zone][self.billing_period]["tier2_limit"]
-            
-            # Determine which tier the current usage falls into
-            if total_consumption <= tier1_limit:
-                tier = "tier1"
-            elif total_consumption <= tier2_limit:
-                tier = "tier2"
-            else:
-                tier = "tier3"
-                
-            # Use year-specific rates when available
-            if year == 2024:
-                return STANDARD_RATES_2024[month][tier]
-            elif year == 2025:
-                return STANDARD_RATES_2025[month][tier]
-            else:
-                # Fallback to seasonal rates for other years
-                if year > 2025:
-                    return STANDARD_RATES_2025[month][tier]
-                else:
-                    # For years before 2024, use the legacy seasonal rates
-                    return STANDARD_RATES[season][tier]
+            return tou_rate(year, month, period)
+
+        # For standard rates (R-1A), the tier depends on total usage and zone/billing period
+        return standard_rate(year, month, self._get_tier())
 
     async def _async_update_data(self) -> Dict[str, Any]:
         """Update the energy data."""
-        try:
-        now = dt_util.now()
-        
+        self._integrate(dt_util.now())
+        self._update_costs()
+        return self.data
+
+    def _integrate(self, now: datetime) -> bool:
+        """Add the energy used since the last sample and take a new sample.
+
+        Returns whether any counter changed.
+        """
+        changed = False
         # Check if we need to reset counters
-        if now >= self._get_next_reset_time():
-                _LOGGER.info("Resetting energy data for new billing cycle")
-            self.data = self._init_energy_data()
-            self.last_reset = self._get_billing_cycle_start()
+        if now >= self._next_reset:
+            # Finish the old billing cycle and publish its final totals
+            if self._integrate_until(self._next_reset):
+                self._async_publish()
+            _LOGGER.info("Resetting energy data for new billing cycle")
+            # Reset in place; the sensors hold a reference to the data
+            self.data.update(self._init_energy_data())
+            self.total_cost = 0.0
+            self.last_reset = self._get_billing_cycle_start(now)
+            self._next_reset = self._get_next_reset_time(now)
+            self._build_cycle_table()
+            self._cost_basis = None
+            self._dirty_periods.clear()
+            changed = True
+            
+        if self._integrate_until(now):
+            changed = True
             
         # Get current state of entities
         grid_power = self._get_entity_state(self.grid_entity_id)
         solar_power = self._get_entity_state(self.solar_entity_id) if self.solar_entity_id else None
         load_power = self._get_entity_state(self.load_entity_id) if self.load_entity_id else None
+        self._last_sample_time = now
+        self._last_power = (grid_power, solar_power, load_power)
         
+        # Updates are event driven, so only report the grid sensor going away
+        # and coming back rather than every sample taken while it is missing
         if grid_power is None:
+            if not self._grid_unavailable:
+                self._grid_unavailable = True
                 _LOGGER.error("Cannot get grid power state for entity: %s", self.grid_entity_id)
-            return self.data
+            return changed
+        if self._grid_unavailable:
+            self._grid_unavailable = False
+            _LOGGER.info("Grid power state available again for entity: %s", self.grid_entity_id)
             
-            _LOGGER.debug(
-                "Entity states - grid: %s, solar: %s, load: %s", 
-                grid_power, solar_power, load_power
-            )
+        _LOGGER.debug(
+            "Entity states - grid: %s, solar: %s, load: %s", 
+            grid_power, solar_power, load_power
+        )
+        return changed
+
+    def _integrate_until(self, now: datetime) -> bool:
+        """Add the energy used from the last sample until now.
+
+        Returns whether any counter changed.
+        """
+        # Power sensors hold their value until they report a new one, so the
+        # previous sample applies to the whole interval (left Riemann sum).
+        # A trapezoid would invent a ramp between two steps.
+        # Work in UTC: subtracting local times that share a tzinfo gives wall
+        # clock differences, which are off by an hour across DST changes.
+        grid_power, solar_power, load_power = self._last_power
+        start = max(dt_util.as_utc(self._last_sample_time), dt_util.as_utc(self.last_reset))
+        until = dt_util.as_utc(now)
+        # Nothing to add while the grid is unavailable or all readings are zero
+        if grid_power is None or not any((grid_power, solar_power, load_power)):
+            return False
             
+        changed = False
+        while start < until:
+            # Periods and rates only change on the hour
+            end = min(until, start.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1))
+            self._accumulate(
+                start,
+                (end - start).total_seconds() * WATTS_TO_KWH_PER_SECOND,
+                grid_power,
+                solar_power,
+                load_power,
+            )
+            start = end
+            changed = True
+        return changed
+
+    def _accumulate(
+        self,
+        moment: datetime,
+        energy_factor: float,
+        grid_power: float,
+        solar_power: Optional[float],
+        load_power: Optional[float],
+    ) -> None:
+        """Add energy drawn at constant power within a single hour to its period."""
+        data = self.data
+        
         # Determine current time period
-        current_period = self._get_time_period(now)
-        current_rate = self._get_rate(now, current_period)
-            
-            _LOGGER.debug("Current period: %s, rate: %s", current_period, current_rate)
+        slot = self._get_cycle_slot(moment)
+        current_period = TOU_PERIODS[self._cycle_periods[slot]]
+        year, month = self._cycle_months[slot]
+        current_rate = self._get_rate(year, month, current_period)
+        
+        _LOGGER.debug("Current period: %s, rate: %s", current_period, current_rate)
         
-        # Calculate energy for this update interval (kWh)
-        grid_energy = grid_power * WATTS_TO_KWH_PER_MINUTE
+        delivered_key, received_key, _, _, generated_key, consumed_key = PERIOD_KEYS[current_period]
+        
+        # Calculate energy for this interval (kWh)
+        grid_energy = grid_power * energy_factor
         
         # Distribute grid energy to appropriate period
         if grid_energy > 0:  # Delivered from grid (consumption)
-            self.data[f"{current_period}_kwh_delivered"] += grid_energy
-            self.data[ATTR_TOTAL_KWH_DELIVERED] += grid_energy
-        else:  # Received by grid (excess solar)
-            received_energy = abs(grid_energy)
-            self.data[f"{current_period}_kwh_received"] += received_energy
-            self.data[ATTR_TOTAL_KWH_RECEIVED] += received_energy
+            data[delivered_key] += grid_energy
+            data[ATTR_TOTAL_KWH_DELIVERED] += grid_energy
+        elif grid_energy < 0:  # Received by grid (excess solar)
+            data[received_key] -= grid_energy
+            data[ATTR_TOTAL_KWH_RECEIVED] -= grid_energy
         
         # Process solar data if available
         if solar_power is not None:
-            solar_energy = solar_power * WATTS_TO_KWH_PER_MINUTE
+            solar_energy = solar_power * energy_factor
             
             # Add to period solar generation
-            self.data[f"{current_period}_kwh_generated"] += solar_energy
-            self.data[ATTR_TOTAL_KWH_GENERATED] += solar_energy
+            data[generated_key] += solar_energy
+            data[ATTR_TOTAL_KWH_GENERATED] += solar_energy
             
             # Calculate savings from solar (at current period rate)
-            self.data[ATTR_SOLAR_COST_SAVINGS] += solar_energy * current_rate
+            data[ATTR_SOLAR_COST_SAVINGS] += solar_energy * current_rate
             
         # Process load data if available
         if load_power is not None:
-            load_energy = load_power * WATTS_TO_KWH_PER_MINUTE
+            load_energy = load_power * energy_factor
             
             # Add to period consumption
-            self.data[f"{current_period}_kwh_consumed"] += load_energy
-            self.data[ATTR_TOTAL_KWH_CONSUMED] += load_energy
+            data[consumed_key] += load_energy
+            data[ATTR_TOTAL_KWH_CONSUMED] += load_energy
             
             # Calculate load cost (at current period rate)
-            self.data[ATTR_LOAD_COST] += load_energy * current_rate
-            
-            # Update net values and costs
-            self._update_net_values_and_costs(now)
+            data[ATTR_LOAD_COST] += load_energy * current_rate
             
-        return self.data
-        except Exception as e:
-            _LOGGER.exception("Error updating LADWP energy data: %s", str(e))
-            # Return existing data on error to avoid breaking the sensor
-            return self.data
+        # Net and cost only depend on grid energy, and only the current
+        # period's changed
+        if grid_energy:
+            self._dirty_periods.add(current_period)
+        self._cost_month = (year, month)
 
     def _get_entity_state(self, entity_id: Optional[str]) -> Optional[float]:
         """Get the current state of an entity as a float."""
@@ -910,29 +1056,39 @@ class LADWPEnergyDataCoordinator(DataUpdateCoordinator):
             return None
             
         state = self.hass.states.get(entity_id)
-        if state is None or state.state == "unknown" or state.state == "unavailable":
+        if state is None:
             return None
+        cached = self._state_cache.get(entity_id)
+        if cached is not None and cached[0] is state:
+            return cached[1]
             
-        try:
-            return float(state.state)
-        except (ValueError, TypeError):
-            _LOGGER.error("Cannot convert state to float for entity %s: %s", entity_id, state.state)
-            return None
-
-    def _get_next_reset_time(self) -> datetime:
-        """Get the next time when the cycle should reset."""
-        now = dt_util.now()
-        if now.day < self.billing_day:
+        value = None
+        if state.state not in UNAVAILABLE_STATES:
+            try:
+                value = float(state.state)
+            except ValueError:
+                _LOGGER.error("Cannot convert state to float for entity %s: %s", entity_id, state.state)
+        self._state_cache[entity_id] = (state, value)
+        return value
+
+    def _get_next_reset_time(self, now: datetime) -> datetime:
+        """Get the next time after now when the cycle should reset."""
+        billing_day = self._get_billing_day(now.year, now.month)
+        if now.day < billing_day:
             # Reset will be this month
             return dt_util.start_of_local_day(
-                datetime(now.year, now.month, self.billing_day)
+                datetime(now.year, now.month, billing_day)
             )
         else:
             # Reset will be next month
             next_month = now.month + 1 if now.month < 12 else 1
             next_month_year = now.year if now.month < 12 else now.year + 1
             return dt_util.start_of_local_day(
-                datetime(next_month_year, next_month, self.billing_day)
+                datetime(
+                    next_month_year,
+                    next_month,
+                    self._get_billing_day(next_month_year, next_month),
+                )
             )
 
 
@@ -952,6 +1108,7 @@ class LADWPBaseSensor(SensorEntity):
         self.coordinator = coordinator
         self._name = name
         self._entity_id = entity_id
+        self._entity_slug = coordinator.entity_slugs[entity_id]
         
         # Will be set by child classes
         self._attr_name = None
@@ -962,7 +1119,7 @@ class LADWPBaseSensor(SensorEntity):
         self._attr_icon = None
         
         # Use the same device info for all sensors
-        device_id = f"ladwp_energy_cost_{entity_id.replace('.', '_')}"
+        device_id = f"ladwp_energy_cost_{self._entity_slug}"
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, device_id)},
             name=name,
@@ -989,10 +1146,6 @@ class LADWPBaseSensor(SensorEntity):
             self.coordinator.async_add_listener(self.async_write_ha_state)
         )
 
-    async def async_update(self) -> None:
-        """Update the entity."""
-        await self.coordinator.async_request_refresh()
-
 
 class LADWPEnergyCostSensor(LADWPBaseSensor):
     """LADWP Energy Cost Sensor."""
@@ -1018,9 +1171,13 @@ class LADWPEnergyCostSensor(LADWPBaseSensor):
         self._zone = zone
         self._billing_period = billing_period
         
+        # State attributes, rebuilt only when a new billing cycle starts
+        self._attrs = None
+        self._attrs_last_reset = None
+        
         # Entity attributes
         self._attr_name = f"{name} Total Cost"
-        self._attr_unique_id = f"ladwp_energy_cost_{grid_entity_id.replace('.', '_')}"
+        self._attr_unique_id = f"ladwp_energy_cost_{self._entity_slug}"
         self._attr_device_class = SensorDeviceClass.MONETARY
         self._attr_state_class = SensorStateClass.TOTAL
         self._attr_native_unit_of_measurement = "USD"
@@ -1029,454 +1186,75 @@ class LADWPEnergyCostSensor(LADWPBaseSensor):
     @property
     def native_value(self) -> float:
         """Return the state of the sensor (total cost)."""
-        return round(sum([
-            self.coordinator.data.get(ATTR_HIGH_PEAK_COST, 0),
-            self.coordinator.data.get(ATTR_LOW_PEAK_COST, 0),
-            self.coordinator.data.get(ATTR_BASE_COST, 0),
-        ]), 2)
+        return self.coordinator.total_cost
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return the state attributes of the sensor."""
-        attrs = {
-            "rate_plan": self._rate_plan,
-            "billing_day": self._billing_day,
-            "zone": self._zone,
-            "billing_period": self._billing_period,
-            "last_reset": self.coordinator.last_reset,
-        }
-        return attrs
-
-
-class LADWPEnergyDeliveredSensor(LADWPBaseSensor):
-    """LADWP Energy Delivered Sensor."""
+        last_reset = self.coordinator.last_reset
+        if self._attrs is None or last_reset != self._attrs_last_reset:
+            self._attrs_last_reset = last_reset
+            self._attrs = {
+                "rate_plan": self._rate_plan,
+                "billing_day": self._billing_day,
+                "zone": self._zone,
+                "billing_period": self._billing_period,
+                "last_reset": last_reset,
+            }
+        return self._attrs
+
+
+class LADWPEnergyValueSensor(LADWPBaseSensor):
+    """LADWP sensor reporting one energy or cost value of the coordinator data."""
 
     def __init__(
         self,
         coordinator: LADWPEnergyDataCoordinator,
         name: str,
         entity_id: str,
-        period: str,
-        metric: str,
+        key: str,
+        label: str,
+        data_key: str,
+        device_class: SensorDeviceClass,
+        state_class: SensorStateClass,
+        icon: str,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, name, entity_id)
-        self._period = period
-        self._metric = metric
+        # The coordinator updates its data dict in place
+        self._data = coordinator.data
+        self._data_key = data_key
         
-        period_name = period.replace("_", " ").title()
-        self._attr_name = f"{name} {period_name} Energy Delivered"
-        self._attr_unique_id = f"ladwp_{period}_{metric}_{entity_id.replace('.', '_')}"
-        self._attr_device_class = SensorDeviceClass.ENERGY
-        self._attr_state_class = SensorStateClass.TOTAL_INCREASING
-        self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-        self._attr_icon = "mdi:transmission-tower-export"
-
-    @property
-    def native_value(self) -> float:
-        """Return the energy delivered in this period."""
-        return round(self.coordinator.data.get(f"{self._period}_kwh_delivered", 0), 3)
-        
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return the state attributes of the sensor."""
-        attrs = super().extra_state_attributes
-        # For TOTAL_INCREASING state class, we don't include last_reset
-        return attrs
-
-
-class LADWPEnergyReceivedSensor(LADWPBaseSensor):
-    """LADWP Energy Received Sensor."""
-
-    def __init__(
-        self,
-        coordinator: LADWPEnergyDataCoordinator,
-        name: str,
-        entity_id: str,
-        period: str,
-        metric: str,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, name, entity_id)
-        self._period = period
-        self._metric = metric
-        
-        period_name = period.replace("_", " ").title()
-        self._attr_name = f"{name} {period_name} Energy Received"
-        self._attr_unique_id = f"ladwp_{period}_{metric}_{entity_id.replace('.', '_')}"
-        self._attr_device_class = SensorDeviceClass.ENERGY
-        self._attr_state_class = SensorStateClass.TOTAL_INCREASING
-        self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-        self._attr_icon = "mdi:transmission-tower-import"
-
-    @property
-    def native_value(self) -> float:
-        """Return the energy received in this period."""
-        return round(self.coordinator.data.get(f"{self._period}_kwh_received", 0), 3)
-        
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return the state attributes of the sensor."""
-        attrs = super().extra_state_attributes
-        # For TOTAL_INCREASING state class, we don't include last_reset
-        return attrs
-
-
-class LADWPEnergyNetSensor(LADWPBaseSensor):
-    """LADWP Energy Net Sensor."""
-
-    def __init__(
-        self,
-        coordinator: LADWPEnergyDataCoordinator,
-        name: str,
-        entity_id: str,
-        period: str,
-        metric: str,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, name, entity_id)
-        self._period = period
-        self._metric = metric
-        
-        period_name = period.replace("_", " ").title()
-        self._attr_name = f"{name} {period_name} Net Energy"
-        self._attr_unique_id = f"ladwp_{period}_{metric}_{entity_id.replace('.', '_')}"
-        self._attr_device_class = SensorDeviceClass.ENERGY
-        self._attr_state_class = SensorStateClass.TOTAL
-        self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-        self._attr_icon = "mdi:power-plug"
-
-    @property
-    def last_reset(self) -> datetime:
-        """Return the time when the sensor was last reset."""
-        return self.coordinator.last_reset
-
-    @property
-    def native_value(self) -> float:
-        """Return the net energy in this period."""
-        return round(self.coordinator.data.get(f"net_{self._period}_kwh", 0), 3)
-        
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return the state attributes of the sensor."""
-        attrs = super().extra_state_attributes
-        # We can add last_reset to attributes for TOTAL state class sensors
-        attrs["last_reset"] = self.coordinator.last_reset
-        return attrs
-
-
-class LADWPPeriodCostSensor(LADWPBaseSensor):
-    """LADWP Period Cost Sensor."""
-
-    def __init__(
-        self,
-        coordinator: LADWPEnergyDataCoordinator,
-        name: str,
-        entity_id: str,
-        period: str,
-        metric: str,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, name, entity_id)
-        self._period = period
-        self._metric = metric
-        
-        period_name = period.replace("_", " ").title()
-        self._attr_name = f"{name} {period_name} Cost"
-        self._attr_unique_id = f"ladwp_{period}_{metric}_{entity_id.replace('.', '_')}"
-        self._attr_device_class = SensorDeviceClass.MONETARY
-        self._attr_state_class = SensorStateClass.TOTAL
-        self._attr_native_unit_of_measurement = "USD"
-        self._attr_icon = "mdi:cash"
-
-    @property
-    def last_reset(self) -> datetime:
-        """Return the time when the sensor was last reset."""
-        return self.coordinator.last_reset
-
-    @property
-    def native_value(self) -> float:
-        """Return the cost for this period."""
-        return round(self.coordinator.data.get(f"{self._period}_cost", 0), 2)
-        
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return the state attributes of the sensor."""
-        attrs = super().extra_state_attributes
-        # We can add last_reset to attributes for TOTAL state class sensors
-        attrs["last_reset"] = self.coordinator.last_reset
-        return attrs
-
-
-class LADWPTotalEnergySensor(LADWPBaseSensor):
-    """LADWP Total Energy Sensor."""
-
-    def __init__(
-        self,
-        coordinator: LADWPEnergyDataCoordinator,
-        name: str,
-        entity_id: str,
-        metric: str,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, name, entity_id)
-        self._metric = metric
-        
-        if metric == "delivered":
-            self._attr_name = f"{name} Total Energy Delivered"
-            self._attr_unique_id = f"ladwp_total_delivered_{entity_id.replace('.', '_')}"
-            self._attr_icon = "mdi:transmission-tower-export"
-            self._attr_device_class = SensorDeviceClass.ENERGY
-            self._attr_state_class = SensorStateClass.TOTAL_INCREASING
-            self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-        elif metric == "received":
-            self._attr_name = f"{name} Total Energy Received"
-            self._attr_unique_id = f"ladwp_total_received_{entity_id.replace('.', '_')}"
-            self._attr_icon = "mdi:transmission-tower-import"
-            self._attr_device_class = SensorDeviceClass.ENERGY
-            self._attr_state_class = SensorStateClass.TOTAL_INCREASING
-            self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
+        self._attr_name = f"{name} {label}"
+        self._attr_unique_id = f"ladwp_{key}_{self._entity_slug}"
+        self._attr_device_class = device_class
+        self._attr_state_class = state_class
+        self._attr_icon = icon
+        # Only TOTAL sensors report when they were last reset
+        self._has_last_reset = state_class == SensorStateClass.TOTAL
+        if device_class == SensorDeviceClass.MONETARY:
+            self._attr_native_unit_of_measurement = "USD"
+            self._precision = 2
         else:
-            self._attr_name = f"{name} Total Net Energy"
-            self._attr_unique_id = f"ladwp_total_net_{entity_id.replace('.', '_')}"
-            self._attr_icon = "mdi:power-plug"
-            self._attr_device_class = SensorDeviceClass.ENERGY
-            self._attr_state_class = SensorStateClass.TOTAL
             self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
+            self._precision = 3
 
     @property
     def last_reset(self) -> Optional[datetime]:
         """Return the time when the sensor was last reset."""
-        # Only for TOTAL state class
-        if self._attr_state_class == SensorStateClass.TOTAL:
+        if self._has_last_reset:
             return self.coordinator.last_reset
         return None
 
     @property
     def native_value(self) -> float:
-        """Return the total energy value."""
-        if self._metric == "delivered":
-            return round(self.coordinator.data.get(ATTR_TOTAL_KWH_DELIVERED, 0), 3)
-        elif self._metric == "received":
-            return round(self.coordinator.data.get(ATTR_TOTAL_KWH_RECEIVED, 0), 3)
-        else:
-            return round(self.coordinator.data.get(ATTR_TOTAL_KWH_NET, 0), 3)
-            
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return the state attributes of the sensor."""
-        attrs = super().extra_state_attributes
-        # Only for TOTAL state class
-        if self._attr_state_class == SensorStateClass.TOTAL:
-            attrs["last_reset"] = self.coordinator.last_reset
-        return attrs
-
-
-class LADWPSolarGenerationSensor(LADWPBaseSensor):
-    """LADWP Solar Generation Sensor."""
-
-    def __init__(
-        self,
-        coordinator: LADWPEnergyDataCoordinator,
-        name: str,
-        entity_id: str,
-        period: str,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, name, entity_id)
-        self._period = period
-        
-        period_name = period.replace("_", " ").title()
-        self._attr_name = f"{name} {period_name} Solar Generation"
-        self._attr_unique_id = f"ladwp_{period}_solar_{entity_id.replace('.', '_')}"
-        self._attr_device_class = SensorDeviceClass.ENERGY
-        self._attr_state_class = SensorStateClass.TOTAL_INCREASING
-        self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-        self._attr_icon = "mdi:solar-power"
-
-    @property
-    def native_value(self) -> float:
-        """Return the solar generation for this period."""
-        return round(self.coordinator.data.get(f"{self._period}_kwh_generated", 0), 3)
-        
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return the state attributes of the sensor."""
-        attrs = super().extra_state_attributes
-        # For TOTAL_INCREASING state class, we don't include last_reset
-        return attrs
-
-
-class LADWPTotalSolarGenerationSensor(LADWPBaseSensor):
-    """LADWP Total Solar Generation Sensor."""
-
-    def __init__(
-        self,
-        coordinator: LADWPEnergyDataCoordinator,
-        name: str,
-        entity_id: str,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, name, entity_id)
-        
-        self._attr_name = f"{name} Total Solar Generation"
-        self._attr_unique_id = f"ladwp_total_solar_{entity_id.replace('.', '_')}"
-        self._attr_device_class = SensorDeviceClass.ENERGY
-        self._attr_state_class = SensorStateClass.TOTAL_INCREASING
-        self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-        self._attr_icon = "mdi:solar-power"
-
-    @property
-    def native_value(self) -> float:
-        """Return the total solar generation."""
-        return round(self.coordinator.data.get(ATTR_TOTAL_KWH_GENERATED, 0), 3)
-        
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return the state attributes of the sensor."""
-        attrs = super().extra_state_attributes
-        # For TOTAL_INCREASING state class, we don't include last_reset
-        return attrs
-
-
-class LADWPSolarSavingsSensor(LADWPBaseSensor):
-    """LADWP Solar Savings Sensor."""
-
-    def __init__(
-        self,
-        coordinator: LADWPEnergyDataCoordinator,
-        name: str,
-        entity_id: str,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, name, entity_id)
-        
-        self._attr_name = f"{name} Solar Savings"
-        self._attr_unique_id = f"ladwp_solar_savings_{entity_id.replace('.', '_')}"
-        self._attr_device_class = SensorDeviceClass.MONETARY
-        self._attr_state_class = SensorStateClass.TOTAL
-        self._attr_native_unit_of_measurement = "USD"
-        self._attr_icon = "mdi:cash-plus"
-
-    @property
-    def last_reset(self) -> datetime:
-        """Return the time when the sensor was last reset."""
-        return self.coordinator.last_reset
-
-    @property
-    def native_value(self) -> float:
-        """Return the total solar cost savings."""
-        return round(self.coordinator.data.get(ATTR_SOLAR_COST_SAVINGS, 0), 2)
-        
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return the state attributes of the sensor."""
-        attrs = super().extra_state_attributes
-        # We can add last_reset to attributes for TOTAL state class sensors
-        attrs["last_reset"] = self.coordinator.last_reset
-        return attrs
-
-
-class LADWPLoadConsumptionSensor(LADWPBaseSensor):
-    """LADWP Load Consumption Sensor."""
-
-    def __init__(
-        self,
-        coordinator: LADWPEnergyDataCoordinator,
-        name: str,
-        entity_id: str,
-        period: str,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, name, entity_id)
-        self._period = period
-        
-        period_name = period.replace("_", " ").title()
-        self._attr_name = f"{name} {period_name} Load Consumption"
-        self._attr_unique_id = f"ladwp_{period}_load_{entity_id.replace('.', '_')}"
-        self._attr_device_class = SensorDeviceClass.ENERGY
-        self._attr_state_class = SensorStateClass.TOTAL_INCREASING
-        self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-        self._attr_icon = "mdi:home-lightning-bolt"
-
-    @property
-    def native_value(self) -> float:
-        """Return the load consumption for this period."""
-        return round(self.coordinator.data.get(f"{self._period}_kwh_consumed", 0), 3)
-        
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return the state attributes of the sensor."""
-        attrs = super().extra_state_attributes
-        # For TOTAL_INCREASING state class, we don't include last_reset
-        return attrs
-
-
-class LADWPTotalLoadConsumptionSensor(LADWPBaseSensor):
-    """LADWP Total Load Consumption Sensor."""
-
-    def __init__(
-        self,
-        coordinator: LADWPEnergyDataCoordinator,
-        name: str,
-        entity_id: str,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, name, entity_id)
-        
-        self._attr_name = f"{name} Total Load Consumption"
-        self._attr_unique_id = f"ladwp_total_load_{entity_id.replace('.', '_')}"
-        self._attr_device_class = SensorDeviceClass.ENERGY
-        self._attr_state_class = SensorStateClass.TOTAL_INCREASING
-        self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-        self._attr_icon = "mdi:home-lightning-bolt"
-
-    @property
-    def native_value(self) -> float:
-        """Return the total load consumption."""
-        return round(self.coordinator.data.get(ATTR_TOTAL_KWH_CONSUMED, 0), 3)
+        """Return the value of the sensor."""
+        return round(self._data.get(self._data_key, 0), self._precision)
         
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return the state attributes of the sensor."""
         attrs = super().extra_state_attributes
-        # For TOTAL_INCREASING state class, we don't include last_reset
-        return attrs
-
-
-class LADWPLoadCostSensor(LADWPBaseSensor):
-    """LADWP Load Cost Sensor."""
-
-    def __init__(
-        self,
-        coordinator: LADWPEnergyDataCoordinator,
-        name: str,
-        entity_id: str,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, name, entity_id)
-        
-        self._attr_name = f"{name} Load Cost"
-        self._attr_unique_id = f"ladwp_load_cost_{entity_id.replace('.', '_')}"
-        self._attr_device_class = SensorDeviceClass.MONETARY
-        self._attr_state_class = SensorStateClass.TOTAL
-        self._attr_native_unit_of_measurement = "USD"
-        self._attr_icon = "mdi:cash-minus"
-
-    @property
-    def last_reset(self) -> datetime:
-        """Return the time when the sensor was last reset."""
-        return self.coordinator.last_reset
-
-    @property
-    def native_value(self) -> float:
-        """Return the total load cost."""
-        return round(self.coordinator.data.get(ATTR_LOAD_COST, 0), 2)
-        
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return the state attributes of the sensor."""
-        attrs = super().extra_state_attributes
-        # We can add last_reset to attributes for TOTAL state class sensors
-        attrs["last_reset"] = self.coordinator.last_reset
+        if self._has_last_reset:
+            attrs["last_reset"] = self.coordinator.last_reset
         return attrs
@@ -0,0 +1 @@
+"""Tests for the LADWP Energy Cost integration."""
@@ -0,0 +1,204 @@
+"""Tests for the LADWP Energy Cost data coordinator."""
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.ladwp_energy_cost.const import (
+    BASE,
+    LOW_PEAK,
+    RATE_PLAN_TIME_OF_USE,
+    TOU_PERIODS,
+)
+from custom_components.ladwp_energy_cost.sensor import (
+    ATTR_TOTAL_KWH_DELIVERED,
+    WATTS_TO_KWH_PER_SECOND,
+    LADWPEnergyDataCoordinator,
+)
+
+# The time zone the test instance runs in
+TZ = dt_util.get_time_zone("US/Pacific")
+
+
+def _make_coordinator(
+    hass: HomeAssistant, billing_day: int = 1
+) -> LADWPEnergyDataCoordinator:
+    """Create a coordinator with only a grid power sensor."""
+    return LADWPEnergyDataCoordinator(
+        hass, "Test", "sensor.grid", None, None, RATE_PLAN_TIME_OF_USE, billing_day
+    )
+
+
+@pytest.mark.parametrize(
+    ("now", "billing_day", "cycle_start", "next_reset"),
+    [
+        (datetime(2025, 2, 15), 29, datetime(2025, 1, 29), datetime(2025, 2, 28)),
+        (datetime(2025, 2, 15), 30, datetime(2025, 1, 30), datetime(2025, 2, 28)),
+        (datetime(2025, 2, 15), 31, datetime(2025, 1, 31), datetime(2025, 2, 28)),
+        (datetime(2025, 4, 15), 29, datetime(2025, 3, 29), datetime(2025, 4, 29)),
+        (datetime(2025, 4, 15), 30, datetime(2025, 3, 30), datetime(2025, 4, 30)),
+        (datetime(2025, 4, 15), 31, datetime(2025, 3, 31), datetime(2025, 4, 30)),
+        (datetime(2025, 11, 15), 29, datetime(2025, 10, 29), datetime(2025, 11, 29)),
+        (datetime(2025, 11, 15), 30, datetime(2025, 10, 30), datetime(2025, 11, 30)),
+        (datetime(2025, 11, 15), 31, datetime(2025, 10, 31), datetime(2025, 11, 30)),
+        # A cycle that starts on a clamped day ends on the full billing day
+        (datetime(2025, 2, 28), 31, datetime(2025, 2, 28), datetime(2025, 3, 31)),
+    ],
+)
+async def test_billing_day_past_end_of_month(
+    hass: HomeAssistant,
+    freezer,
+    now: datetime,
+    billing_day: int,
+    cycle_start: datetime,
+    next_reset: datetime,
+) -> None:
+    """Test billing days beyond the end of a month fall on its last day."""
+    freezer.move_to(now.replace(tzinfo=TZ))
+    coordinator = _make_coordinator(hass, billing_day)
+
+    assert coordinator.last_reset == cycle_start.replace(tzinfo=TZ)
+    assert coordinator._next_reset == next_reset.replace(tzinfo=TZ)
+
+
+def _utc(*args: int) -> datetime:
+    """Create a UTC datetime."""
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+def _sample_constant_power(
+    hass: HomeAssistant, freezer, start: datetime, billing_day: int = 1
+) -> LADWPEnergyDataCoordinator:
+    """Create a coordinator at start that has sampled a 1000 W grid draw."""
+    freezer.move_to(start)
+    coordinator = _make_coordinator(hass, billing_day)
+    hass.states.async_set("sensor.grid", "1000")
+    coordinator._integrate(start.astimezone(TZ))
+    return coordinator
+
+
+@pytest.mark.parametrize(
+    ("start", "end", "chunks"),
+    [
+        (
+            _utc(2025, 11, 5, 18, 45),
+            _utc(2025, 11, 5, 20, 15),
+            [
+                (_utc(2025, 11, 5, 18, 45), 900),
+                (_utc(2025, 11, 5, 19), 3600),
+                (_utc(2025, 11, 5, 20), 900),
+            ],
+        ),
+        # 01:30 PST to 03:30 PDT is a single hour
+        (
+            _utc(2025, 3, 9, 9, 30),
+            _utc(2025, 3, 9, 10, 30),
+            [(_utc(2025, 3, 9, 9, 30), 1800), (_utc(2025, 3, 9, 10), 1800)],
+        ),
+    ],
+)
+async def test_integration_splits_on_utc_hours(
+    hass: HomeAssistant,
+    freezer,
+    start: datetime,
+    end: datetime,
+    chunks: list[tuple[datetime, int]],
+) -> None:
+    """Test elapsed time is split into the hours it falls in."""
+    coordinator = _sample_constant_power(hass, freezer, start)
+
+    with patch.object(
+        coordinator, "_accumulate", wraps=coordinator._accumulate
+    ) as accumulate:
+        coordinator._integrate(end.astimezone(TZ))
+
+    assert [call.args[0] for call in accumulate.call_args_list] == [
+        moment for moment, _ in chunks
+    ]
+    assert [call.args[1] for call in accumulate.call_args_list] == pytest.approx(
+        [seconds * WATTS_TO_KWH_PER_SECOND for _, seconds in chunks]
+    )
+
+
+@pytest.mark.parametrize(
+    ("start", "minutes", "energy"),
+    [
+        # 01:55 PST, five minutes later it is 03:00 PDT
+        (datetime(2025, 3, 9, 1, 55), 5, 1000 * 5 / 60 / 1000),
+        # 01:30 PDT, an hour later it is 01:30 PST
+        (datetime(2025, 11, 2, 1, 30), 60, 1.0),
+    ],
+)
+async def test_integration_across_dst_changes(
+    hass: HomeAssistant, freezer, start: datetime, minutes: int, energy: float
+) -> None:
+    """Test energy follows elapsed time rather than the wall clock."""
+    start = start.replace(tzinfo=TZ)
+    end = (start.astimezone(timezone.utc) + timedelta(minutes=minutes)).astimezone(TZ)
+    coordinator = _sample_constant_power(hass, freezer, start)
+    coordinator._integrate(end)
+
+    assert coordinator.data[ATTR_TOTAL_KWH_DELIVERED] == pytest.approx(energy)
+
+
+async def test_reset_publishes_old_cycle_energy(
+    hass: HomeAssistant, freezer
+) -> None:
+    """Test energy up to the billing boundary is published in the old cycle."""
+    coordinator = _sample_constant_power(
+        hass, freezer, datetime(2025, 11, 19, 23, 30, tzinfo=TZ), 20
+    )
+
+    published = []
+    with patch.object(
+        coordinator,
+        "_async_publish",
+        side_effect=lambda: published.append(
+            coordinator.data[ATTR_TOTAL_KWH_DELIVERED]
+        ),
+    ):
+        coordinator._integrate(datetime(2025, 11, 20, 0, 30, tzinfo=TZ))
+
+    assert published == [pytest.approx(0.5)]
+    assert coordinator.last_reset == datetime(2025, 11, 20, tzinfo=TZ)
+    assert coordinator.data[ATTR_TOTAL_KWH_DELIVERED] == pytest.approx(0.5)
+
+
+@pytest.mark.parametrize(
+    ("now", "billing_day", "slots"),
+    [
+        (datetime(2025, 1, 15), 1, 744),
+        # Spring forward drops an hour
+        (datetime(2025, 3, 15), 1, 743),
+        # Fall back repeats an hour
+        (datetime(2025, 11, 15), 1, 721),
+        (datetime(2025, 11, 5), 20, 745),
+    ],
+)
+async def test_cycle_table_slot_count(
+    hass: HomeAssistant, freezer, now: datetime, billing_day: int, slots: int
+) -> None:
+    """Test the cycle table has one slot per elapsed hour of the cycle."""
+    freezer.move_to(now.replace(tzinfo=TZ))
+    coordinator = _make_coordinator(hass, billing_day)
+
+    assert len(coordinator._cycle_periods) == slots
+    assert len(coordinator._cycle_months) == slots
+
+
+async def test_cycle_table_periods_after_fall_back(
+    hass: HomeAssistant, freezer
+) -> None:
+    """Test hours after the fall back change keep their local time period."""
+    freezer.move_to(datetime(2025, 11, 5, tzinfo=TZ))
+    coordinator = _make_coordinator(hass, 20)
+
+    for moment, period in (
+        (datetime(2025, 11, 5, 10, 30, tzinfo=TZ), LOW_PEAK),
+        (datetime(2025, 11, 5, 20, 30, tzinfo=TZ), BASE),
+    ):
+        slot = coordinator._get_cycle_slot(moment)
+        assert TOU_PERIODS[coordinator._cycle_periods[slot]] == period